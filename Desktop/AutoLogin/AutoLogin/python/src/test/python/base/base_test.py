@@ -4,17 +4,28 @@ Base test class providing common setup, teardown, and utilities for all test cas
 """
 
 import pytest
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support.wait import WebDriverWait
 from utilities.driver_factory import DriverFactory
 from utilities.logger_config import LoggerConfig
 from utilities.screenshot_handler import ScreenshotHandler
-from config.config_reader import ConfigReader
+from config.config_reader import get_config
+
+
+# Common loading spinners, matched by a single DOM query (every match must be hidden)
+_SPINNER_LOCATOR = (By.CSS_SELECTOR, ".spinner, .loader, .loading, #loading")
+
+# Visible page text checks evaluated in the browser (arguments[0] = text)
+_PAGE_TEXT_CONTAINS_SCRIPT = "return document.body.innerText.indexOf(arguments[0]) !== -1;"
+_PAGE_TEXT_EXACT_SCRIPT = "return document.body.innerText.trim() === arguments[0];"
 
 
 class BaseTest:
     """
     Base class for all test cases.
     Provides:
-    - WebDriver setup and teardown
+    - WebDriver setup (shared session driver, reset between tests)
     - Logging configuration
     - Screenshot handling
     - Common test utilities
@@ -22,15 +33,34 @@ class BaseTest:
     All test classes should inherit from this class.
     """
     
+    # Shared by every test; loaded once at import
+    config = get_config()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Create each test class' logger once, not in every test's setup"""
+        super().__init_subclass__(**kwargs)
+        cls.logger = LoggerConfig.get_logger(cls.__name__)
+    
     @pytest.fixture(autouse=True)
-    def setup_and_teardown(self):
+    def setup_and_teardown(self, request):
         """
         Automatic setup and teardown fixture for each test
+        
+        Reuses the session-scoped `driver` fixture (one browser per xdist
+        worker) and resets its state instead of launching a browser per test.
+        With --fresh-driver every test gets its own browser, quit afterwards.
+        
+        Args:
+            request: PyTest request object
         """
-        # Setup
-        self.logger = LoggerConfig.get_logger(self.__class__.__name__)
-        self.config = ConfigReader()
-        self.driver = DriverFactory.create_driver()
+        # Setup (logger and config are class attributes)
+        self._test_name = request.node.name
+        fresh_driver = request.config.getoption("--fresh-driver")
+        if fresh_driver:
+            self.driver = DriverFactory.create_driver()
+        else:
+            self.driver = request.getfixturevalue("driver")
+            DriverFactory.reset_driver(self.driver)
         self.screenshot_handler = ScreenshotHandler()
         
         self.logger.info(f"{'='*60}")
@@ -43,11 +73,9 @@ class BaseTest:
         self.logger.info(f"{'='*60}")
         self.logger.info(f"Finishing test: {self._get_test_name()}")
         self.logger.info(f"{'='*60}")
-        
-        try:
+        # The session driver is quit by the `driver` fixture at session end
+        if fresh_driver:
             DriverFactory.quit_driver(self.driver)
-        except Exception as e:
-            self.logger.error(f"Error during teardown: {str(e)}")
     
     def _get_test_name(self):
         """
@@ -56,22 +84,28 @@ class BaseTest:
         Returns:
             str: Test method name
         """
-        # Extract test method name from the current test context
-        return self.__class__.__name__
+        # Captured from request.node once per test in setup_and_teardown
+        return self._test_name
     
     # ==================== Common Test Utilities ====================
     
-    def navigate_to_app(self):
+    def navigate_to_app(self, page=None):
         """
         Navigate to application base URL from config
+        
+        Args:
+            page: Optional page object with a load(url) method (e.g. LoginPage).
+                  Its load() navigates and waits only for the page's key element.
         """
         try:
             base_url = self.config.get_base_url()
-            self.driver.get(base_url)
+            if page is not None:
+                page.load(base_url)
+            else:
+                self.driver.get(base_url)
             self.logger.info(f"Navigated to base URL: {base_url}")
         except Exception as e:
             self.logger.error(f"Error navigating to application: {str(e)}")
-            self.take_screenshot("navigation_error")
             raise
     
     def take_screenshot(self, filename_prefix=None):
@@ -103,13 +137,15 @@ class BaseTest:
     
     # ==================== Assertion Methods ====================
     
-    def assert_text_in_page(self, text, locator=None):
+    def assert_text_in_page(self, text, locator=None, exact=False):
         """
         Assert that text is present in page or element
         
         Args:
             text (str): Text to verify
             locator (tuple): Optional element locator. If None, checks full page.
+            exact (bool): Without a locator, require the page's visible text
+                          to equal the text instead of containing it
             
         Raises:
             AssertionError: If text not found
@@ -119,13 +155,16 @@ class BaseTest:
                 element_text = self.driver.find_element(*locator).text
                 assert text in element_text, f"Text '{text}' not found in element"
             else:
-                page_text = self.driver.page_source
-                assert text in page_text, f"Text '{text}' not found in page"
+                # Search in the browser so only a boolean crosses the wire
+                found = self.driver.execute_script(
+                    _PAGE_TEXT_EXACT_SCRIPT if exact else _PAGE_TEXT_CONTAINS_SCRIPT,
+                    text
+                )
+                assert found, f"Text '{text}' not found in page"
             
             self.logger.info(f"Assertion passed: Text '{text}' found")
         except AssertionError as e:
             self.logger.error(f"Assertion failed: {str(e)}")
-            self.take_screenshot("assertion_failed")
             raise
     
     def assert_element_visible(self, locator):
@@ -144,7 +183,6 @@ class BaseTest:
             self.logger.info(f"Assertion passed: Element {locator} is visible")
         except AssertionError as e:
             self.logger.error(f"Assertion failed: {str(e)}")
-            self.take_screenshot("element_not_visible")
             raise
     
     def assert_url_contains(self, url_text):
@@ -163,7 +201,6 @@ class BaseTest:
             self.logger.info(f"Assertion passed: URL contains '{url_text}'")
         except AssertionError as e:
             self.logger.error(f"Assertion failed: {str(e)}")
-            self.take_screenshot("url_assertion_failed")
             raise
     
     def assert_page_title_contains(self, title_text):
@@ -182,7 +219,6 @@ class BaseTest:
             self.logger.info(f"Assertion passed: Title contains '{title_text}'")
         except AssertionError as e:
             self.logger.error(f"Assertion failed: {str(e)}")
-            self.take_screenshot("title_assertion_failed")
             raise
     
     # ==================== Helper Methods ====================
@@ -194,26 +230,17 @@ class BaseTest:
         Args:
             timeout (int): Timeout in seconds
         """
-        from selenium.webdriver.support.wait import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        
         try:
-            # Wait for common loading spinners to disappear
-            spinner_locators = [
-                (By.CLASS_NAME, "spinner"),
-                (By.CLASS_NAME, "loader"),
-                (By.CLASS_NAME, "loading"),
-                (By.ID, "loading"),
-            ]
-            
-            wait = WebDriverWait(self.driver, timeout)
-            for locator in spinner_locators:
-                try:
-                    wait.until(EC.invisibility_of_element_located(locator))
-                except:
-                    pass
-            
+            # Wait until no matching spinner is displayed; a spinner removed
+            # between lookup and check counts as gone on the next poll
+            WebDriverWait(
+                self.driver, timeout, ignored_exceptions=(StaleElementReferenceException,)
+            ).until(
+                lambda driver: not any(
+                    element.is_displayed()
+                    for element in driver.find_elements(*_SPINNER_LOCATOR)
+                )
+            )
             self.logger.info("Loading complete")
         except Exception as e:
             self.logger.warning(f"Error waiting for loading: {str(e)}")
@@ -4,42 +4,124 @@ Handles reading configuration properties from config.properties file
 """
 
 import os
+import json
 import configparser
 from pathlib import Path
 
 
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "config.properties"
+
+# Parsed settings cached next to config.properties, keyed by its mtime
+VALUES_CACHE_PATH = CONFIG_PATH.with_name(".config_values.json")
+
+# Part of the cache key; bump when _parse_values() output changes
+VALUES_CACHE_VERSION = 1
+
+
 class ConfigReader:
     """
     Reads and manages configuration properties for the test framework.
-    Follows singleton pattern to ensure single instance.
+    A single shared instance is built at import; obtain it with get_config().
     """
     
-    _instance = None
     _config = None
+    _values = None
     
-    def __new__(cls):
-        """Implement singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super(ConfigReader, cls).__new__(cls)
-            cls._instance._load_config()
-        return cls._instance
+    def __init__(self):
+        """Initialize ConfigReader by loading config.properties"""
+        self._load_config()
     
     def _load_config(self):
-        """Load configuration from properties file"""
+        """
+        Load configuration from properties file and pre-compute typed values
+        
+        The typed values are reused from the on-disk cache while
+        config.properties is unchanged, so pytest-xdist workers skip the INI
+        parse; configparser is then only run for ad-hoc get() lookups.
+        """
         try:
-            # Get the path to config.properties
-            config_path = Path(__file__).parent.parent / "config" / "config.properties"
-            
-            if not config_path.exists():
-                raise FileNotFoundError(f"Config file not found at {config_path}")
+            if not CONFIG_PATH.exists():
+                raise FileNotFoundError(f"Config file not found at {CONFIG_PATH}")
             
-            self._config = configparser.ConfigParser()
-            self._config.read(config_path)
+            cache_key = f"v{VALUES_CACHE_VERSION}:{CONFIG_PATH.stat().st_mtime_ns}"
+            self._values = self._load_values_cache(cache_key)
+            if self._values is None:
+                self._read_properties()
+                self._values = self._parse_values()
+                self._save_values_cache(cache_key)
             
         except Exception as e:
             print(f"Error loading configuration: {str(e)}")
             raise
     
+    def _read_properties(self):
+        """Parse config.properties with configparser"""
+        self._config = configparser.ConfigParser()
+        self._config.read(CONFIG_PATH)
+    
+    def _load_values_cache(self, cache_key):
+        """
+        Load typed values cached for the current config.properties
+        
+        Args:
+            cache_key (str): Cache version and config file mtime
+            
+        Returns:
+            dict: Cached values, or None if missing or stale
+        """
+        try:
+            with open(VALUES_CACHE_PATH, encoding='utf-8') as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        return cached.get('values') if cached.get('key') == cache_key else None
+    
+    def _save_values_cache(self, cache_key):
+        """
+        Write typed values to the cache (atomic replace, safe for parallel workers)
+        
+        Args:
+            cache_key (str): Cache version and config file mtime
+        """
+        tmp_path = VALUES_CACHE_PATH.with_name(f"{VALUES_CACHE_PATH.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump({'key': cache_key, 'values': self._values}, cache_file)
+            os.replace(tmp_path, VALUES_CACHE_PATH)
+        except OSError as e:
+            print(f"Could not write config cache {VALUES_CACHE_PATH}: {str(e)}")
+    
+    def _parse_values(self):
+        """
+        Read every known setting once, converted to its final type
+        
+        Returns:
+            dict: Setting name -> value, used by the get_* accessors
+        """
+        def flag(section, key, default):
+            return self.get(section, key, default).lower() == 'true'
+        
+        page_load_strategy = self.get('browser', 'page_load_strategy', 'eager').lower()
+        if page_load_strategy not in ('normal', 'eager', 'none'):
+            page_load_strategy = 'eager'
+        
+        return {
+            'browser': self.get('browser', 'name', 'chrome'),
+            'headless': flag('browser', 'headless', 'false'),
+            'disable_images': flag('browser', 'disable_images', 'false'),
+            'page_load_strategy': page_load_strategy,
+            'base_url': self.get('application', 'base_url', 'http://localhost:8080'),
+            'grid_url': self.get('grid', 'url', '').strip(),
+            'implicit_wait': int(self.get('wait', 'implicit_wait', '0')),
+            'explicit_wait': int(self.get('wait', 'explicit_wait', '15')),
+            'screenshot_enabled': flag('screenshot', 'on_failure', 'true'),
+            'screenshot_path': self.get('screenshot', 'path', './screenshots'),
+            'report_path': self.get('reporting', 'report_path', './reports'),
+            'log_level': self.get('logging', 'level', 'INFO'),
+            'log_path': self.get('logging', 'log_path', './logs'),
+            'locator_cache_path': self.get('locators', 'cache_path', './global_locators.json'),
+        }
+    
     def get(self, section, key, default=None):
         """
         Get configuration value
@@ -53,6 +135,8 @@ class ConfigReader:
             Configuration value or default
         """
         try:
+            if self._config is None:
+                self._read_properties()
             if self._config.has_option(section, key):
                 return self._config.get(section, key)
             return default
@@ -62,42 +146,70 @@ class ConfigReader:
     
     def get_browser(self):
         """Get browser type from config"""
-        return self.get('browser', 'name', 'chrome')
+        return self._values['browser']
     
     def get_base_url(self):
         """Get base URL from config"""
-        return self.get('application', 'base_url', 'http://localhost:8080')
+        return self._values['base_url']
     
     def get_implicit_wait(self):
         """Get implicit wait time from config"""
-        return int(self.get('wait', 'implicit_wait', '10'))
+        return self._values['implicit_wait']
     
     def get_explicit_wait(self):
         """Get explicit wait time from config"""
-        return int(self.get('wait', 'explicit_wait', '15'))
+        return self._values['explicit_wait']
     
     def get_headless_mode(self):
         """Get headless mode setting from config"""
-        value = self.get('browser', 'headless', 'false')
-        return value.lower() == 'true'
+        return self._values['headless']
+    
+    def get_disable_images(self):
+        """Get whether image loading is disabled in the browser"""
+        return self._values['disable_images']
+    
+    def get_page_load_strategy(self):
+        """Get page load strategy (normal, eager or none) from config, eager by default"""
+        return self._values['page_load_strategy']
+    
+    def get_grid_url(self):
+        """Get Selenium Grid hub URL from config (empty = run browsers locally)"""
+        return self._values['grid_url']
     
     def get_screenshot_enabled(self):
         """Get screenshot on failure setting from config"""
-        value = self.get('screenshot', 'on_failure', 'true')
-        return value.lower() == 'true'
+        return self._values['screenshot_enabled']
     
     def get_screenshot_path(self):
         """Get screenshot directory path from config"""
-        return self.get('screenshot', 'path', './screenshots')
+        return self._values['screenshot_path']
     
     def get_report_path(self):
         """Get report directory path from config"""
-        return self.get('reporting', 'report_path', './reports')
+        return self._values['report_path']
     
     def get_log_level(self):
         """Get logging level from config"""
-        return self.get('logging', 'level', 'INFO')
+        return self._values['log_level']
     
     def get_log_path(self):
         """Get log file path from config"""
-        return self.get('logging', 'log_path', './logs')
+        return self._values['log_path']
+    
+    def get_locator_cache_path(self):
+        """Get healed locator cache file path from config"""
+        return self._values['locator_cache_path']
+
+
+# Shared instance, loaded once when the module is first imported
+_CONFIG = ConfigReader()
+
+
+def get_config():
+    """
+    Get the shared ConfigReader instance
+    
+    Returns:
+        ConfigReader: Configuration loaded at import time
+    """
+    return _CONFIG
@@ -4,20 +4,63 @@ Provides shared fixtures and configurations for all tests
 """
 
 import pytest
+import shutil
+import tempfile
+from pathlib import Path
 from utilities.logger_config import LoggerConfig
 import sys
 import os
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+# Add src directory to path for imports (once, even if conftest is re-imported)
+_SRC_DIR = str(Path(__file__).resolve().parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+# Logger used by the reporting hooks, fetched once instead of per test
+_PYTEST_LOGGER = LoggerConfig.get_logger("pytest", log_dir="./logs")
+
+# Marker added to every test collected from test_login*.py
+_LOGIN_MARKER = pytest.mark.login
+
+# Plugins of pytest's cacheprovider (.pytest_cache reads/writes)
+_CACHE_PLUGINS = ("cacheprovider", "lfplugin", "nfplugin")
+
+# Options (by dest) that need the cache; the cache stays on when any is given
+_CACHE_OPTIONS = ("lf", "failedfirst", "newfirst", "stepwise", "cacheshow", "cacheclear")
+
+
+def pytest_addoption(parser):
+    """
+    Register framework command line options
+    """
+    parser.addoption(
+        "--fresh-driver",
+        action="store_true",
+        default=False,
+        help="Launch a new browser for every test instead of reusing the session driver"
+    )
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Keep pytest's .pytest_cache (off by default; implied by --lf/--ff/--nf/--sw)"
+    )
 
 
 def pytest_configure(config):
     """
     PyTest configuration hook
     Called after command line options have been parsed
+    
+    Turns pytest's cache off unless requested, so runs don't stat and write
+    .pytest_cache (once per xdist worker).
     """
-    LoggerConfig.get_logger("pytest", log_dir="./logs")
+    cache_requested = config.getoption("--cached") or any(
+        config.getoption(option, False) for option in _CACHE_OPTIONS
+    )
+    if not cache_requested:
+        for plugin_name in _CACHE_PLUGINS:
+            config.pluginmanager.set_blocked(plugin_name)
 
 
 @pytest.fixture(scope="session")
@@ -38,6 +81,70 @@ def test_session():
     logger.info("=" * 70)
 
 
+@pytest.fixture(scope="session")
+def driver():
+    """
+    Session-level WebDriver fixture, one browser per pytest-xdist worker
+    
+    Shared by every test of the worker (BaseTest resets its state between
+    tests) so the browser is launched once instead of per test.
+    
+    Each session gets a fresh Chrome profile, so cookies never carry over
+    between runs and concurrent runs never contend for a user-data-dir. Only
+    the HTTP disk cache (one per worker) persists, so cached CSS/JS is reused
+    by every test of the worker and by later runs.
+    """
+    from utilities.driver_factory import DriverFactory
+    
+    worker_id = LoggerConfig.get_worker_id()
+    user_data_dir = tempfile.mkdtemp(prefix=f"chrome-{worker_id}-")
+    disk_cache_dir = os.path.join(tempfile.gettempdir(), f"chrome-cache-{worker_id}")
+    web_driver = DriverFactory.create_driver(user_data_dir=user_data_dir, disk_cache_dir=disk_cache_dir)
+    
+    yield web_driver
+    
+    DriverFactory.quit_driver(web_driver)
+    shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def valid_creds():
+    """
+    Valid login credentials, shared by all tests of the session
+    
+    Returns:
+        tuple: (username, password)
+    """
+    return ("testuser@example.com", "TestPassword123!")
+
+
+@pytest.fixture(scope="session")
+def auth_cookie(valid_creds, driver):
+    """
+    Session cookies of a logged-in user, created with a single login
+    
+    Tests that only need an authenticated page (not the login flow itself)
+    inject these with driver.add_cookie() after opening the app's domain,
+    skipping the login form entirely.
+    
+    Returns:
+        list: Cookie dicts from driver.get_cookies()
+    """
+    from config.config_reader import get_config
+    from utilities.driver_factory import DriverFactory
+    from pages.base_pages.login_page import LoginPage
+    
+    DriverFactory.reset_driver(driver)
+    login_page = LoginPage(driver)
+    login_page.load(get_config().get_base_url())
+    login_page.login(*valid_creds)
+    login_page.wait_helper.wait_for_condition(
+        lambda web_driver: "dashboard" in web_driver.current_url,
+        description="redirect to dashboard"
+    )
+    return driver.get_cookies()
+
+
 @pytest.fixture
 def test_case():
     """
@@ -47,31 +154,96 @@ def test_case():
     yield
 
 
+# (test class node id, exception type) pairs already captured by this worker
+_failure_screenshots = set()
+
+
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
     Hook for test result collection
     Called after test execution
+    
+    Takes a failure screenshot only for the first failure of each exception
+    type in a test class; later failures with the same signature are logged
+    without another full-page capture.
     """
-    if call.when == "call":
-        if call.excinfo is not None:
-            # Test failed
-            logger = LoggerConfig.get_logger("pytest")
-            logger.error(f"FAILED: {item.name}")
-        else:
-            # Test passed
-            logger = LoggerConfig.get_logger("pytest")
-            logger.info(f"PASSED: {item.name}")
+    outcome = yield
+    report = outcome.get_result()
+    
+    if report.when != "call":
+        return
+    
+    if call.excinfo is not None:
+        # Test failed
+        _PYTEST_LOGGER.error(f"FAILED: {item.name}")
+        if report.failed:
+            _capture_failure_screenshot(item, call.excinfo.typename)
+    else:
+        # Test passed
+        _PYTEST_LOGGER.info(f"PASSED: {item.name}")
 
 
+def _capture_failure_screenshot(item, exception_name):
+    """
+    Capture a screenshot for a failed test, once per class and exception type
+    
+    Args:
+        item: Failed pytest item
+        exception_name (str): Name of the exception the test failed with
+    """
+    from config.config_reader import get_config
+    
+    signature = (item.parent.nodeid, exception_name)
+    if signature in _failure_screenshots or not get_config().get_screenshot_enabled():
+        return
+    
+    web_driver = getattr(item.instance, "driver", None) or item.funcargs.get("driver")
+    if web_driver is None:
+        return
+    
+    _failure_screenshots.add(signature)
+    from utilities.screenshot_handler import ScreenshotHandler
+    try:
+        ScreenshotHandler().capture_screenshot_on_failure(web_driver, item.name)
+    except Exception as e:
+        # Never let a broken browser session mask the original test failure
+        _PYTEST_LOGGER.warning(f"Failure screenshot skipped: {str(e)}")
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
     """
     Hook for modifying test collection
     Add markers for test organization
+    
+    Runs before pytest's own -m/-k deselection so markers added here
+    (including @test_method groups) are used for selection.
     """
+    from utilities.testng_decorators import marker_names
+    
+    registered = {line.split(":", 1)[0].split("(", 1)[0].strip() for line in config.getini("markers")}
     for item in items:
         # Add marker based on test file
-        if "test_login" in item.nodeid:
-            item.add_marker(pytest.mark.login)
+        if item.path.name.startswith("test_login"):
+            item.add_marker(_LOGIN_MARKER)
+        
+        # Doctest/plugin items have no Python function to read metadata from
+        function = getattr(item, "function", None)
+        if function is None:
+            continue
+        
+        # @test_method groups/priority become markers; register free-form groups
+        # first so --strict-markers does not reject them
+        for marker_name in marker_names(function):
+            if marker_name not in registered:
+                config.addinivalue_line("markers", f"{marker_name}: @test_method group")
+                registered.add(marker_name)
+            item.add_marker(marker_name)
+        
+        # @test_method(enabled=False) leaves the function unwrapped, skip it here
+        if getattr(function, "enabled", True) is False:
+            item.add_marker(pytest.mark.skip(reason=f"Test {item.name} is disabled"))
 
 
 # ==================== Pytest Configuration Options ====================
@@ -98,6 +270,14 @@ To run tests with specific configurations:
    
 7. Run in parallel (requires pytest-xdist):
    pytest -n auto
+   Each worker (gw0, gw1, ...) writes its own log file and the `driver`
+   fixture gives each worker an isolated browser profile.
+   
+   Run every test in its own browser (slower, full isolation):
+   pytest --fresh-driver
+   
+   Keep pytest's .pytest_cache (needed by --lf/--ff, which enable it themselves):
+   pytest --cached
    
 8. Run with HTML report (requires pytest-html):
    pytest --html=reports/report.html --self-contained-html
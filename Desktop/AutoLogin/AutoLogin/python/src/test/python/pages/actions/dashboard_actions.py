@@ -4,10 +4,16 @@ Page-specific actions for dashboard functionality
 Example page demonstrating the actions structure
 """
 
-from pages.actions.base_actions import BaseActions
+import re
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from pages.actions.base_actions import BaseActions, log_action
 from pages.locators.dashboard_locators import DashboardLocators
 
 
+# First number in badge text such as "5", "12 new" or "99+"
+_BADGE_RE = re.compile(r"(\d+)")
+
+
 class DashboardActions(BaseActions):
     """
     Dashboard page actions encapsulating all dashboard-related interactions.
@@ -15,10 +21,12 @@ class DashboardActions(BaseActions):
     Inherits from BaseActions which inherits from BasePage.
     """
     
+    __slots__ = ()
+    
     def __init__(self, driver):
         """Initialize DashboardActions with WebDriver instance"""
         super().__init__(driver)
-        self.locators = DashboardLocators()
+        self.set_locators(DashboardLocators())
     
     # ==================== Verification Methods ====================
     
@@ -30,8 +38,10 @@ class DashboardActions(BaseActions):
             bool: True if dashboard elements are visible
         """
         try:
-            is_displayed = self.is_element_displayed(self.locators.MAIN_CONTENT) and \
-                          self.is_element_displayed(self.locators.WELCOME_MESSAGE)
+            is_displayed = self.are_elements_displayed([
+                self.locators.MAIN_CONTENT,
+                self.locators.WELCOME_MESSAGE
+            ])
             
             if is_displayed:
                 self.logger.info("Dashboard is displayed")
@@ -40,28 +50,20 @@ class DashboardActions(BaseActions):
             
             return is_displayed
         except Exception as e:
-            self.logger.error(f"Error checking dashboard: {str(e)}")
+            self.logger.error("Error checking dashboard: %s", e)
             return False
     
     # ==================== User Actions ====================
     
+    @log_action("Clicked user profile button", "Error clicking user profile")
     def click_user_profile(self):
         """Click on user profile button"""
-        try:
-            self.click_element(self.locators.USER_PROFILE_BUTTON)
-            self.logger.info("Clicked user profile button")
-        except Exception as e:
-            self.logger.error(f"Error clicking user profile: {str(e)}")
-            raise
+        self.click_element(self.locators.USER_PROFILE_BUTTON)
     
+    @log_action("Clicked logout button", "Error logging out")
     def logout(self):
         """Logout from dashboard"""
-        try:
-            self.click_element(self.locators.LOGOUT_BUTTON)
-            self.logger.info("Clicked logout button")
-        except Exception as e:
-            self.logger.error(f"Error logging out: {str(e)}")
-            raise
+        self.click_element(self.locators.LOGOUT_BUTTON)
     
     # ==================== Information Retrieval ====================
     
@@ -74,22 +76,18 @@ class DashboardActions(BaseActions):
         """
         try:
             message = self.get_element_text(self.locators.WELCOME_MESSAGE)
-            self.logger.info(f"Welcome message: {message}")
+            self.logger.info("Welcome message: %s", message)
             return message
         except Exception as e:
-            self.logger.error(f"Error getting welcome message: {str(e)}")
+            self.logger.error("Error getting welcome message: %s", e)
             return None
     
     # ==================== Navigation ====================
     
+    @log_action("Clicked settings link", "Error clicking settings")
     def click_settings(self):
         """Click on settings link"""
-        try:
-            self.click_element(self.locators.SETTINGS_LINK)
-            self.logger.info("Clicked settings link")
-        except Exception as e:
-            self.logger.error(f"Error clicking settings: {str(e)}")
-            raise
+        self.click_element(self.locators.SETTINGS_LINK)
     
     def get_notification_count(self):
         """
@@ -99,9 +97,9 @@ class DashboardActions(BaseActions):
             int: Number of notifications or 0 if not found
         """
         try:
-            badge_text = self.get_element_text(self.locators.NOTIFICATION_BADGE)
-            count = int(badge_text) if badge_text else 0
-            return count
-        except Exception as e:
-            self.logger.debug(f"Error getting notification count: {str(e)}")
+            badge_text = self.get_element_text(self.locators.NOTIFICATION_BADGE) or ""
+        except (TimeoutException, NoSuchElementException) as e:
+            self.logger.debug("Notification badge not found: %s", e)
             return 0
+        match = _BADGE_RE.search(badge_text)
+        return int(match.group(1)) if match else 0
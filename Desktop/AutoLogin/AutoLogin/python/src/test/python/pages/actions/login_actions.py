@@ -3,7 +3,7 @@ LoginPage Actions Module
 Page-specific actions for login functionality
 """
 
-from pages.actions.base_actions import BaseActions
+from pages.actions.base_actions import BaseActions, log_action
 from pages.locators.login_locators import LoginLocators
 
 
@@ -14,10 +14,26 @@ class LoginActions(BaseActions):
     Follows Page Object Model pattern for maintainability.
     """
     
+    __slots__ = ()
+    
+    # Seconds to wait for error/success messages after submitting the form
+    MESSAGE_TIMEOUT = 3
+    
     def __init__(self, driver):
         """Initialize LoginActions with WebDriver instance"""
         super().__init__(driver)
-        self.locators = LoginLocators()
+        self.set_locators(LoginLocators())
+    
+    # ==================== Navigation ====================
+    
+    def load(self, url):
+        """
+        Open the login page, continuing as soon as the username field exists
+        
+        Args:
+            url (str): Login page URL
+        """
+        self.navigate_to(url, ready_locator=self.locators.USERNAME_INPUT)
     
     # ==================== Verification Methods ====================
     
@@ -29,9 +45,11 @@ class LoginActions(BaseActions):
             bool: True if login page elements are visible
         """
         try:
-            is_displayed = self.is_element_displayed(self.locators.PAGE_TITLE) and \
-                          self.is_element_displayed(self.locators.USERNAME_INPUT) and \
-                          self.is_element_displayed(self.locators.PASSWORD_INPUT)
+            is_displayed = self.are_elements_displayed([
+                self.locators.PAGE_TITLE,
+                self.locators.USERNAME_INPUT,
+                self.locators.PASSWORD_INPUT
+            ])
             
             if is_displayed:
                 self.logger.info("Login page is displayed")
@@ -40,11 +58,12 @@ class LoginActions(BaseActions):
             
             return is_displayed
         except Exception as e:
-            self.logger.error(f"Error checking login page: {str(e)}")
+            self.logger.error("Error checking login page: %s", e)
             return False
     
     # ==================== Input Actions ====================
     
+    @log_action("Username entered", "Error entering username")
     def enter_username(self, username):
         """
         Enter username/email in the username field
@@ -52,13 +71,9 @@ class LoginActions(BaseActions):
         Args:
             username (str): Username or email address
         """
-        try:
-            self.send_keys(self.locators.USERNAME_INPUT, username)
-            self.logger.info(f"Entered username: {username}")
-        except Exception as e:
-            self.logger.error(f"Error entering username: {str(e)}")
-            raise
+        self.send_keys(self.locators.USERNAME_INPUT, username)
     
+    @log_action("Password entered", "Error entering password")
     def enter_password(self, password):
         """
         Enter password in the password field
@@ -66,96 +81,70 @@ class LoginActions(BaseActions):
         Args:
             password (str): User password
         """
-        try:
-            self.send_keys(self.locators.PASSWORD_INPUT, password)
-            self.logger.info("Password entered")  # Don't log actual password
-        except Exception as e:
-            self.logger.error(f"Error entering password: {str(e)}")
-            raise
+        self.send_keys(self.locators.PASSWORD_INPUT, password)
     
+    @log_action("Username field cleared", "Error clearing username")
     def clear_username(self):
         """Clear username field"""
-        try:
-            element = self.wait_helper.wait_for_element_visible(self.locators.USERNAME_INPUT)
-            element.clear()
-            self.logger.info("Username field cleared")
-        except Exception as e:
-            self.logger.error(f"Error clearing username: {str(e)}")
-            raise
+        self._with_element(
+            self.locators.USERNAME_INPUT,
+            self.wait_helper.wait_for_element_visible,
+            lambda element: element.clear()
+        )
     
+    @log_action("Password field cleared", "Error clearing password")
     def clear_password(self):
         """Clear password field"""
-        try:
-            element = self.wait_helper.wait_for_element_visible(self.locators.PASSWORD_INPUT)
-            element.clear()
-            self.logger.info("Password field cleared")
-        except Exception as e:
-            self.logger.error(f"Error clearing password: {str(e)}")
-            raise
+        self._with_element(
+            self.locators.PASSWORD_INPUT,
+            self.wait_helper.wait_for_element_visible,
+            lambda element: element.clear()
+        )
     
     # ==================== Button & Link Click Actions ====================
     
+    @log_action("Login button clicked", "Error clicking login button")
     def click_login_button(self):
         """
         Click the login button to submit credentials
         """
-        try:
-            self.click_element(self.locators.LOGIN_BUTTON)
-            self.logger.info("Login button clicked")
-        except Exception as e:
-            self.logger.error(f"Error clicking login button: {str(e)}")
-            raise
+        self.click_element(self.locators.LOGIN_BUTTON)
     
+    @log_action("Clicked 'Forgot Password' link", "Error clicking 'Forgot Password'")
     def click_forgot_password(self):
         """
         Click on 'Forgot Password' link
         """
-        try:
-            self.click_element(self.locators.FORGOT_PASSWORD_LINK)
-            self.logger.info("Clicked 'Forgot Password' link")
-        except Exception as e:
-            self.logger.error(f"Error clicking 'Forgot Password': {str(e)}")
-            raise
+        self.click_element(self.locators.FORGOT_PASSWORD_LINK)
     
+    @log_action("Clicked 'Sign Up' link", "Error clicking 'Sign Up'")
     def click_signup_link(self):
         """
         Click on 'Sign Up' link
         """
-        try:
-            self.click_element(self.locators.SIGNUP_LINK)
-            self.logger.info("Clicked 'Sign Up' link")
-        except Exception as e:
-            self.logger.error(f"Error clicking 'Sign Up': {str(e)}")
-            raise
+        self.click_element(self.locators.SIGNUP_LINK)
     
     # ==================== Checkbox Actions ====================
     
+    @log_action("'Remember Me' checkbox checked", "Error checking 'Remember Me'")
     def check_remember_me(self):
         """
         Check the 'Remember Me' checkbox
         """
-        try:
-            if not self.is_remember_me_checked():
-                self.click_element(self.locators.REMEMBER_ME_CHECKBOX)
-                self.logger.info("'Remember Me' checkbox checked")
-        except Exception as e:
-            self.logger.error(f"Error checking 'Remember Me': {str(e)}")
-            raise
+        if not self.is_remember_me_checked():
+            self.click_element(self.locators.REMEMBER_ME_CHECKBOX)
     
+    @log_action("'Remember Me' checkbox unchecked", "Error unchecking 'Remember Me'")
     def uncheck_remember_me(self):
         """
         Uncheck the 'Remember Me' checkbox
         """
-        try:
-            if self.is_remember_me_checked():
-                self.click_element(self.locators.REMEMBER_ME_CHECKBOX)
-                self.logger.info("'Remember Me' checkbox unchecked")
-        except Exception as e:
-            self.logger.error(f"Error unchecking 'Remember Me': {str(e)}")
-            raise
+        if self.is_remember_me_checked():
+            self.click_element(self.locators.REMEMBER_ME_CHECKBOX)
     
     # ==================== Composite Actions ====================
     
+    @log_action("Login process completed", "Error during login")
     def login(self, username, password, remember_me=False):
         """
         Complete login process with username and password
@@ -165,29 +154,28 @@ class LoginActions(BaseActions):
             password (str): User password
             remember_me (bool): Whether to check 'Remember Me' checkbox
         """
-        try:
-            self.logger.info("Starting login process")
-            
-            # Verify page is loaded
-            if not self.is_login_page_displayed():
-                raise Exception("Login page not properly loaded")
-            
-            # Enter credentials
+        self.logger.info("Starting login process")
+        
+        # Verify page is loaded
+        if not self.is_login_page_displayed():
+            raise Exception("Login page not properly loaded")
+        
+        if remember_me:
+            # Checkbox state needs a real click, keep the step-by-step flow
             self.enter_username(username)
             self.enter_password(password)
-            
-            # Check remember me if required
-            if remember_me:
-                self.check_remember_me()
-            
-            # Click login button
+            self.check_remember_me()
             self.click_login_button()
-            
-            self.logger.info("Login process completed")
-            
-        except Exception as e:
-            self.logger.error(f"Error during login: {str(e)}")
-            raise
+        else:
+            # Enter credentials and submit in one round-trip
+            self.fill_and_submit(
+                {
+                    self.locators.USERNAME_INPUT: username,
+                    self.locators.PASSWORD_INPUT: password
+                },
+                self.locators.LOGIN_BUTTON
+            )
+            self.logger.info("Entered username: %s", username)
     
     def login_and_verify_error(self, username, password):
         """
@@ -206,13 +194,13 @@ class LoginActions(BaseActions):
             
             if self.is_error_message_displayed():
                 error_msg = self.get_error_message()
-                self.logger.info(f"Error message received: {error_msg}")
+                self.logger.info("Error message received: %s", error_msg)
                 return error_msg
             else:
                 raise Exception("Expected error message not displayed")
                 
         except Exception as e:
-            self.logger.error(f"Error in login_and_verify_error: {str(e)}")
+            self.logger.error("Error in login_and_verify_error: %s", e)
             raise
     
     # ==================== Message Retrieval ====================
@@ -226,10 +214,10 @@ class LoginActions(BaseActions):
         """
         try:
             error_text = self.get_element_text(self.locators.ERROR_MESSAGE)
-            self.logger.warning(f"Error message displayed: {error_text}")
+            self.logger.warning("Error message displayed: %s", error_text)
             return error_text
         except Exception as e:
-            self.logger.debug(f"No error message found: {str(e)}")
+            self.logger.debug("No error message found: %s", e)
             return None
     
     def get_success_message(self):
@@ -241,10 +229,10 @@ class LoginActions(BaseActions):
         """
         try:
             success_text = self.get_element_text(self.locators.SUCCESS_MESSAGE)
-            self.logger.info(f"Success message displayed: {success_text}")
+            self.logger.info("Success message displayed: %s", success_text)
             return success_text
         except Exception as e:
-            self.logger.debug(f"No success message found: {str(e)}")
+            self.logger.debug("No success message found: %s", e)
             return None
     
     # ==================== State Check Methods ====================
@@ -257,10 +245,10 @@ class LoginActions(BaseActions):
             bool: True if error message is visible
         """
         try:
-            is_displayed = self.is_element_displayed(self.locators.ERROR_MESSAGE)
+            is_displayed = self.is_element_displayed(self.locators.ERROR_MESSAGE, timeout=self.MESSAGE_TIMEOUT)
             return is_displayed
         except Exception as e:
-            self.logger.debug(f"Error checking error message: {str(e)}")
+            self.logger.debug("Error checking error message: %s", e)
             return False
     
     def is_success_message_displayed(self):
@@ -271,10 +259,10 @@ class LoginActions(BaseActions):
             bool: True if success message is visible
         """
         try:
-            is_displayed = self.is_element_displayed(self.locators.SUCCESS_MESSAGE)
+            is_displayed = self.is_element_displayed(self.locators.SUCCESS_MESSAGE, timeout=self.MESSAGE_TIMEOUT)
             return is_displayed
         except Exception as e:
-            self.logger.debug(f"Error checking success message: {str(e)}")
+            self.logger.debug("Error checking success message: %s", e)
             return False
     
     def is_remember_me_checked(self):
@@ -288,11 +276,28 @@ class LoginActions(BaseActions):
             is_checked = self.is_element_selected(self.locators.REMEMBER_ME_CHECKBOX)
             return is_checked
         except Exception as e:
-            self.logger.debug(f"Error checking 'Remember Me': {str(e)}")
+            self.logger.debug("Error checking 'Remember Me': %s", e)
             return False
     
     # ==================== Attribute Retrieval ====================
     
+    def get_placeholders(self):
+        """
+        Get placeholder texts of username and password fields in one round-trip
+        
+        Returns:
+            tuple: (username placeholder, password placeholder), None if unavailable
+        """
+        try:
+            username_placeholder, password_placeholder = self.batch_get([
+                (self.locators.USERNAME_INPUT, "placeholder"),
+                (self.locators.PASSWORD_INPUT, "placeholder")
+            ])
+            return username_placeholder, password_placeholder
+        except Exception as e:
+            self.logger.debug("Error getting placeholders: %s", e)
+            return None, None
+    
     def get_username_placeholder(self):
         """
         Get placeholder text from username field
@@ -300,12 +305,7 @@ class LoginActions(BaseActions):
         Returns:
             str: Placeholder text
         """
-        try:
-            placeholder = self.get_element_attribute(self.locators.USERNAME_INPUT, "placeholder")
-            return placeholder
-        except Exception as e:
-            self.logger.debug(f"Error getting username placeholder: {str(e)}")
-            return None
+        return self.get_placeholders()[0]
     
     def get_password_placeholder(self):
         """
@@ -314,12 +314,7 @@ class LoginActions(BaseActions):
         Returns:
             str: Placeholder text
         """
-        try:
-            placeholder = self.get_element_attribute(self.locators.PASSWORD_INPUT, "placeholder")
-            return placeholder
-        except Exception as e:
-            self.logger.debug(f"Error getting password placeholder: {str(e)}")
-            return None
+        return self.get_placeholders()[1]
     
     def is_login_button_enabled(self):
         """
@@ -332,5 +327,5 @@ class LoginActions(BaseActions):
             is_enabled = self.is_element_enabled(self.locators.LOGIN_BUTTON)
             return is_enabled
         except Exception as e:
-            self.logger.debug(f"Error checking login button enabled state: {str(e)}")
+            self.logger.debug("Error checking login button enabled state: %s", e)
             return False
@@ -5,6 +5,20 @@ Provides structure for creating locator classes for other pages
 """
 
 from abc import ABC
+from typing import NamedTuple
+from selenium.webdriver.common.by import By
+
+
+class Locator(NamedTuple):
+    """
+    Selenium locator, unpacks exactly like a (By.X, "value") tuple
+    
+    Named fields make locators readable in logs and debuggers, and the exact
+    type lets get_all_locators tell locators apart from other class tuples.
+    """
+    
+    by: str
+    value: str
 
 
 class BaseLocators(ABC):
@@ -17,25 +31,63 @@ class BaseLocators(ABC):
     - Easy to maintain and update selectors
     - Separate from action logic
     - Easy to switch between locator strategies
+    
+    Subclasses may define FALLBACKS, mapping a locator name to alternative
+    locators tried in order (test id -> aria -> css -> text) when the primary
+    one stops matching. See utilities.smart_find.SmartFind.
     """
     
+    FALLBACKS = {}
+    
     @classmethod
     def get_all_locators(cls):
         """
         Get all locators for this page as dictionary
         
+        Built once per class and cached on it (locators are class constants);
+        treat the returned dict as read-only.
+        
         Returns:
             dict: Dictionary of all locator attributes
         """
+        # Look in the class' own __dict__ so subclasses don't reuse a parent's cache
+        locators = cls.__dict__.get('_cached_locators')
+        if locators is not None:
+            return locators
+        
+        # Walk the class namespaces directly (subclass first, so overrides win)
+        # instead of dir(), which also lists every ABC/object attribute
         locators = {}
-        for attr_name in dir(cls):
-            attr_value = getattr(cls, attr_name)
-            # Include only tuples (locators) and not private attributes
-            if isinstance(attr_value, tuple) and len(attr_value) == 2 and \
-               not attr_name.startswith('_'):
-                locators[attr_name] = attr_value
+        for klass in cls.__mro__:
+            for attr_name, attr_value in vars(klass).items():
+                # Include only locators (Locator or plain 2-tuples) and not private attributes
+                attr_type = type(attr_value)
+                if (attr_type is Locator or (attr_type is tuple and len(attr_value) == 2)) and \
+                   not attr_name.startswith('_'):
+                    locators.setdefault(attr_name, attr_value)
+        cls._cached_locators = locators
         return locators
     
+    @classmethod
+    def get_css_batch(cls):
+        """
+        Get all CSS selector locators joined into a single selector group
+        
+        Lets callers fetch every CSS-addressable element of the page with one
+        find_elements(By.CSS_SELECTOR, ...) call instead of one per locator.
+        Results come back in document order, not locator order.
+        
+        Returns:
+            str: Comma-separated selector group ("" if the page has none)
+        """
+        batch = cls.__dict__.get('_cached_css_batch')
+        if batch is None:
+            batch = cls._cached_css_batch = ", ".join(
+                value for by, value in cls.get_all_locators().values()
+                if by == By.CSS_SELECTOR
+            )
+        return batch
+    
     @classmethod
     def get_locator_count(cls):
         """
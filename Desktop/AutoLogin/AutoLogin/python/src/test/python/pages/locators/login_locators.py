@@ -4,7 +4,7 @@ Centralized locators for login page elements
 """
 
 from selenium.webdriver.common.by import By
-from pages.locators.base_locators import BaseLocators
+from pages.locators.base_locators import BaseLocators, Locator
 
 
 class LoginLocators(BaseLocators):
@@ -16,32 +16,61 @@ class LoginLocators(BaseLocators):
     
     # ==================== Input Fields ====================
     # Username/Email input field
-    USERNAME_INPUT = (By.ID, "username")
+    USERNAME_INPUT = Locator(By.ID, "username")
     
     # Password input field
-    PASSWORD_INPUT = (By.ID, "password")
+    PASSWORD_INPUT = Locator(By.ID, "password")
     
     # ==================== Buttons ====================
-    # Login button
-    LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Login')]")
+    # Login button (CSS: native querySelector instead of an XPath text scan)
+    LOGIN_BUTTON = Locator(By.CSS_SELECTOR, "button[data-testid='login-submit'], button.login-btn")
     
     # ==================== Checkboxes ====================
     # Remember me checkbox
-    REMEMBER_ME_CHECKBOX = (By.ID, "rememberMe")
+    REMEMBER_ME_CHECKBOX = Locator(By.ID, "rememberMe")
     
     # ==================== Links ====================
     # Forgot password link
-    FORGOT_PASSWORD_LINK = (By.LINK_TEXT, "Forgot Password?")
+    FORGOT_PASSWORD_LINK = Locator(By.LINK_TEXT, "Forgot Password?")
     
     # Sign up link
-    SIGNUP_LINK = (By.LINK_TEXT, "Sign Up")
+    SIGNUP_LINK = Locator(By.LINK_TEXT, "Sign Up")
     
     # ==================== Messages & Display Elements ====================
     # Error message display
-    ERROR_MESSAGE = (By.CLASS_NAME, "error-message")
+    ERROR_MESSAGE = Locator(By.CLASS_NAME, "error-message")
     
     # Success message display
-    SUCCESS_MESSAGE = (By.CLASS_NAME, "success-message")
+    SUCCESS_MESSAGE = Locator(By.CLASS_NAME, "success-message")
     
-    # Page title/heading
-    PAGE_TITLE = (By.XPATH, "//h1[contains(text(), 'Login')]")
+    # Page title/heading (compare its text in Python when the wording matters)
+    PAGE_TITLE = Locator(By.CSS_SELECTOR, "h1.login-title")
+    
+    # ==================== Self-Healing Fallbacks ====================
+    # Alternatives tried in order when a primary locator stops matching
+    FALLBACKS = {
+        'USERNAME_INPUT': [
+            (By.CSS_SELECTOR, "[data-testid='username']"),
+            (By.CSS_SELECTOR, "input[aria-label='Username']"),
+            (By.CSS_SELECTOR, "input[name='username'], input[type='email']"),
+        ],
+        'PASSWORD_INPUT': [
+            (By.CSS_SELECTOR, "[data-testid='password']"),
+            (By.CSS_SELECTOR, "input[aria-label='Password']"),
+            (By.CSS_SELECTOR, "input[type='password']"),
+        ],
+        'LOGIN_BUTTON': [
+            (By.XPATH, "//button[contains(text(), 'Login')]"),
+            (By.CSS_SELECTOR, "[data-testid='login-button']"),
+            (By.CSS_SELECTOR, "button[aria-label='Login']"),
+            (By.CSS_SELECTOR, "button[type='submit'], input[type='submit']"),
+            (By.XPATH, "//*[self::button or self::a][normalize-space()='Log in' or normalize-space()='Sign in']"),
+        ],
+        'PAGE_TITLE': [
+            (By.XPATH, "//h1[contains(text(), 'Login')]"),
+        ],
+        'REMEMBER_ME_CHECKBOX': [
+            (By.CSS_SELECTOR, "[data-testid='remember-me']"),
+            (By.CSS_SELECTOR, "input[type='checkbox'][name='rememberMe']"),
+        ],
+    }
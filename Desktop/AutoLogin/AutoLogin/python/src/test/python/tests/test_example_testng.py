@@ -0,0 +1,428 @@
+"""
+Example test file demonstrating TestNG decorator usage in PyTest.
+
+This file shows:
+- Using @test_method decorator with various options
+- Using @before_method and @after_method decorators
+- Using @data_provider for parameterized tests
+- Using @skip decorator
+- Organizing tests with pytest markers
+- Creating test dependencies
+"""
+
+import pytest
+from time import perf_counter
+from types import SimpleNamespace
+from base.base_test import BaseTest
+from pages.base_pages.login_page import LoginPage
+from pages.base_pages.dashboard_page import DashboardPage
+# Imported as a module: a bare test_method name would be collected by pytest
+from utilities import testng_decorators as ng
+
+
+# Valid account used by the examples (constant, shared by all tests)
+_VALID = SimpleNamespace(user='user@example.com', pw='password123')
+
+
+class TestLogsTestNG(BaseTest):
+    """
+    Demonstrates TestNG decorator patterns with PyTest.
+    
+    This test class shows best practices for:
+    - Test organization with decorators
+    - Setup/teardown with decorators
+    - Parameterized tests
+    - Test grouping
+    - Priority and dependencies
+    """
+    
+    # ==================== CLASS SETUP/TEARDOWN ====================
+    
+    @ng.before_class()
+    def setup_class_testng(self):
+        """
+        Runs once before all tests in this class.
+        
+        TestNG equivalent: @BeforeClass
+        PyTest equivalent: setup_class (but with decorator pattern)
+        """
+        self.logger.debug("SETUP CLASS: %s", type(self).__name__)
+    
+    @ng.after_class()
+    def cleanup_class_testng(self):
+        """
+        Runs once after all tests in this class complete.
+        
+        TestNG equivalent: @AfterClass
+        PyTest equivalent: teardown_class (but with decorator pattern)
+        """
+        self.logger.debug("CLEANUP CLASS: %s", type(self).__name__)
+    
+    # ==================== TEST METHOD EXAMPLES ====================
+    
+    @ng.test_method(
+        name="successful_login_testng",
+        description="Demonstrate successful login with TestNG decorator",
+        priority=1,
+        groups=["smoke", "login", "priority1"],
+        enabled=True,
+        timeout=10000
+    )
+    def test_successful_login_with_decorator(self):
+        """
+        Example: Basic test decorated with @test_method.
+        
+        Features:
+        - Uses @test_method with metadata (name, description, priority)
+        - Groups: smoke, login, priority1 (can run: pytest -m smoke)
+        - Enabled: true (test will run)
+        - Timeout: 10 seconds
+        - Priority: 1 (high priority)
+        
+        TestNG equivalent:
+        @Test(
+            testName = "successful_login_testng",
+            description = "...",
+            priority = 1,
+            groups = {"smoke", "login", "priority1"},
+            enabled = true,
+            timeOut = 10000
+        )
+        public void testSuccessfulLogin() { }
+        """
+        # Test implementation
+        self.navigate_to_app()
+        login_page = LoginPage(self.driver)
+        login_page.login(_VALID.user, 
+                        _VALID.pw)
+        
+        # Assertion
+        self.assert_url_contains("dashboard")
+        assert DashboardPage(self.driver).is_dashboard_displayed()
+    
+    @ng.test_method(
+        name="login_with_invalid_username",
+        description="Test login fails with invalid username",
+        priority=2,
+        groups=["regression", "login"],
+        enabled=True
+    )
+    def test_login_invalid_username(self):
+        """
+        Example: Test with lower priority and regression group.
+        
+        Features:
+        - Priority: 2 (medium priority)
+        - Groups: regression, login
+        - No timeout specified (uses default)
+        
+        TestNG equivalent:
+        @Test(priority = 2, groups = {"regression", "login"})
+        """
+        self.navigate_to_app()
+        login_page = LoginPage(self.driver)
+        login_page.login("invalid_user@example.com", 
+                        _VALID.pw)
+        
+        # Should see error message
+        assert login_page.is_error_message_displayed()
+    
+    @ng.test_method(
+        name="login_with_invalid_password",
+        description="Test login fails with invalid password",
+        priority=2,
+        groups=["regression", "login"]
+    )
+    def test_login_invalid_password(self):
+        """
+        Example: Another regression test.
+        """
+        self.navigate_to_app()
+        login_page = LoginPage(self.driver)
+        login_page.login(_VALID.user, 
+                        "wrong_password")
+        
+        assert login_page.is_error_message_displayed()
+    
+    # ==================== PARAMETERIZED TEST EXAMPLE ====================
+    
+    @ng.test_method(
+        name="login_with_multiple_users",
+        description="Test login with multiple user data sets",
+        priority=3,
+        groups=["functional", "login"]
+    )
+    @ng.data_provider([
+        ["admin@example.com", "admin123"],
+        ["user1@example.com", "pass123"],
+        ["user2@example.com", "pass456"],
+        ["manager@example.com", "mgr789"]
+    ])
+    def test_login_multiple_users(self, username, password):
+        """
+        Example: Parameterized test using @data_provider.
+        
+        Features:
+        - @data_provider passes multiple data sets
+        - Test runs once per data set
+        - Each iteration tests different username/password
+        
+        TestNG equivalent:
+        @DataProvider(name = "loginData")
+        public Object[][] getLoginData() {
+            return new Object[][] {
+                {"admin@example.com", "admin123"},
+                {"user1@example.com", "pass123"}
+            };
+        }
+        
+        @Test(dataProvider = "loginData")
+        public void testLoginMultipleUsers(String username, String password) { }
+        """
+        self.navigate_to_app()
+        login_page = LoginPage(self.driver)
+        login_page.login(username, password)
+        
+        # After successful login, user should be on dashboard
+        self.assert_url_contains("dashboard")
+    
+    # ==================== SKIPPED TEST EXAMPLE ====================
+    
+    @ng.skip(reason="Feature not yet implemented - waiting for backend API")
+    @ng.test_method(
+        name="biometric_login",
+        description="Test biometric login functionality",
+        priority=1,
+        groups=["smoke"]
+    )
+    @pytest.mark.skip(reason="Feature not yet implemented")
+    def test_biometric_login(self):
+        """
+        Example: Skipped test with @skip decorator.
+        
+        Features:
+        - @skip marks test to be skipped
+        - reason parameter explains why
+        - Test won't execute or count as failure
+        
+        TestNG equivalent:
+        @Test(skip = true)
+        public void testBiometricLogin() { }
+        """
+        # This won't run
+        pass
+    
+    # ==================== UI COMPONENT TEST ====================
+    
+    @ng.test_method(
+        name="verify_login_page_elements",
+        description="Verify all login page elements are visible",
+        priority=2,
+        groups=["ui", "smoke"]
+    )
+    def test_login_page_elements_visible(self):
+        """
+        Example: UI test checking element visibility.
+        """
+        self.navigate_to_app()
+        login_page = LoginPage(self.driver)
+        locators = login_page.locators
+        
+        # Verify all UI elements are displayed (one WebDriver round-trip;
+        # locators that are not visible are healed and re-checked once)
+        username, password, login_button, remember_me = login_page.batch_is_displayed([
+            locators.USERNAME_INPUT,
+            locators.PASSWORD_INPUT,
+            locators.LOGIN_BUTTON,
+            locators.REMEMBER_ME_CHECKBOX
+        ])
+        assert username, "Username field is not visible"
+        assert password, "Password field is not visible"
+        assert login_button, "Login button is not visible"
+        assert remember_me, "Remember Me checkbox is not visible"
+    
+    # ==================== INTEGRATION TEST ====================
+    
+    @ng.test_method(
+        name="full_login_and_logout_flow",
+        description="Test complete login and logout flow",
+        priority=1,
+        groups=["integration", "critical"]
+    )
+    def test_full_login_logout_flow(self):
+        """
+        Example: Integration test with multiple steps.
+        """
+        # Login
+        self.navigate_to_app()
+        login_page = LoginPage(self.driver)
+        login_page.login(_VALID.user, 
+                        _VALID.pw)
+        
+        # Verify dashboard
+        dashboard = DashboardPage(self.driver)
+        assert dashboard.is_dashboard_displayed()
+        
+        # Logout
+        dashboard.logout()
+        
+        # Verify back at login page
+        assert login_page.is_login_page_displayed()
+
+
+# ==================== HELPER TEST CLASS ====================
+
+class TestNGDecoratorShowcase(BaseTest):
+    """
+    Additional examples showing decorator combinations.
+    """
+    
+    @ng.before_method()
+    def setup_each_test(self):
+        """
+        Runs before each test method.
+        
+        TestNG equivalent: @BeforeMethod
+        """
+        self.logger.debug("SETUP TEST METHOD")
+        self.login_page = LoginPage(self.driver)
+    
+    @ng.after_method(alwaysRun=True)
+    def cleanup_each_test(self):
+        """
+        Runs after each test method, even if test fails.
+        
+        Features:
+        - alwaysRun=True: Runs regardless of test result
+        - Good for cleanup that must happen (e.g., logout, close resources)
+        
+        TestNG equivalent:
+        @AfterMethod(alwaysRun = true)
+        """
+        self.logger.debug("CLEANUP TEST METHOD")
+        # Could take screenshot here on failure
+        # Could logout here
+        # Could close resources
+    
+    @ng.test_method(
+        name="dependent_test",
+        description="Test that depends on another test",
+        depends_on_methods=["test_successful_login_testng"],
+        priority=2,
+        groups=["integration"]
+    )
+    def test_depends_on_login(self):
+        """
+        Example: Test with dependency on another test.
+        
+        Features:
+        - depends_on_methods: Only runs if dependent tests pass
+        - In PyTest, this is noted but not enforced (by design)
+        - Useful as metadata for reporting
+        
+        TestNG equivalent:
+        @Test(dependsOnMethods = {"testSuccessfulLogin"})
+        """
+        # This conceptually depends on successful login, so log in here too
+        self.navigate_to_app()
+        LoginPage(self.driver).login(_VALID.user, _VALID.pw)
+        
+        dashboard = DashboardPage(self.driver)
+        assert dashboard.is_dashboard_displayed()
+    
+    @ng.test_method(
+        name="performance_test",
+        description="Performance test for login",
+        priority=3,
+        groups=["performance"],
+        timeout=5000
+    )
+    def test_login_performance(self):
+        """
+        Example: Performance test with timeout.
+        """
+        self.navigate_to_app()
+        start = perf_counter()
+        
+        login_page = LoginPage(self.driver)
+        login_page.login(_VALID.user, _VALID.pw)
+        
+        elapsed = perf_counter() - start
+        
+        # Assert login completes within 5 seconds
+        assert elapsed < 5, f"Login took {elapsed}s, expected < 5s"
+
+
+# ==================== UTILITY EXAMPLES ====================
+
+class TestNGUtilityExamples:
+    """
+    Examples of using TestNG utility functions.
+    These only read the registry, so no browser (BaseTest) is needed.
+    """
+    
+    def test_get_test_registry(self):
+        """
+        Example: Accessing test registry to view test metadata.
+        """
+        # Get all registered tests
+        all_tests = ng.get_test_registry()
+        
+        print("\n" + "="*60)
+        print("ALL REGISTERED TESTS:")
+        print("="*60)
+        for test_name, test_info in all_tests.items():
+            print(f"\nTest: {test_name}")
+            print(f"  Description: {test_info.get('description', 'N/A')}")
+            print(f"  Priority: {test_info.get('priority', 'N/A')}")
+            print(f"  Groups: {test_info.get('groups', [])}")
+    
+    def test_get_tests_by_group(self):
+        """
+        Example: Getting tests by group.
+        """
+        # Get all smoke tests
+        smoke_tests = ng.get_tests_by_group('smoke')
+        
+        print("\n" + "="*60)
+        print(f"SMOKE TESTS ({len(smoke_tests)}):")
+        print("="*60)
+        for test_info in smoke_tests:
+            print(f"  - {test_info['name']}: {test_info.get('description', 'N/A')}")
+
+
+# ==================== RUNNING THESE TESTS ====================
+
+"""
+COMMAND EXAMPLES:
+
+1. Run all tests in this file:
+   pytest tests/test_example_testng.py -v
+
+2. Run only smoke tests:
+   pytest tests/test_example_testng.py -m smoke -v
+
+3. Run only login tests:
+   pytest tests/test_example_testng.py -m login -v
+
+4. Run parameterized test (test_login_multiple_users):
+   pytest tests/test_example_testng.py::TestLogsTestNG::test_login_multiple_users -v
+
+5. Run tests by priority:
+   pytest tests/test_example_testng.py -m priority1 -v
+
+6. Run integration tests:
+   pytest tests/test_example_testng.py -m integration -v
+
+7. Run high-priority integration tests:
+   pytest tests/test_example_testng.py -m "integration and priority1" -v
+
+8. Run all except skipped:
+   pytest tests/test_example_testng.py -v
+
+9. Using TestNG Suite Runner:
+   python -m utilities.testng_suite_runner run "Smoke Tests"
+
+10. Run in parallel:
+    pytest tests/test_example_testng.py -n auto -v
+"""
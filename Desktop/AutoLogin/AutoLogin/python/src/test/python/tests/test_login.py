@@ -0,0 +1,264 @@
+"""
+Login Test Cases
+Test suite for login functionality using Page Object Model
+Uses TestNG-style annotations for test organization
+"""
+
+import pytest
+from base.base_test import BaseTest
+from pages.base_pages.login_page import LoginPage
+from pages.locators.login_locators import LoginLocators
+
+
+class TestLogin(BaseTest):
+    """
+    Test class for login functionality
+    Inherits from BaseTest for automatic setup/teardown and utilities
+    """
+    
+    @pytest.fixture(autouse=True)
+    def setup_login_tests(self):
+        """
+        Setup specific to login tests
+        Initialize page objects required for tests
+        """
+        self.login_page = LoginPage(self.driver)
+        self.locators = LoginLocators()
+        yield
+    
+    # ==================== Test Cases ====================
+    
+    @pytest.mark.smoke
+    @pytest.mark.login
+    @pytest.mark.priority1
+    def test_successful_login(self, valid_creds):
+        """
+        Test Case: TC_LOGIN_001 - Successful Login
+        
+        Preconditions:
+            - User is on login page
+            - Valid credentials are available
+            
+        Test Steps:
+            1. Navigate to login page
+            2. Enter valid username
+            3. Enter valid password
+            4. Click login button
+            
+        Expected Result:
+            - Login should be successful
+            - User should be redirected to dashboard
+        """
+        try:
+            # Arrange
+            username, password = valid_creds
+            
+            # Act
+            self.navigate_to_app(self.login_page)
+            assert self.login_page.is_login_page_displayed(), \
+                "Login page is not displayed"
+            
+            self.login_page.login(username, password)
+            
+            # Assert
+            self.wait_for_loading_to_complete()
+            self.assert_url_contains("dashboard")
+            
+            self.logger.info("✓ Test passed: Successful login")
+            
+        except AssertionError as e:
+            self.logger.error(f"✗ Test failed: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"✗ Test error: {str(e)}")
+            raise
+    
+    @pytest.mark.login
+    @pytest.mark.regression
+    @pytest.mark.parametrize(
+        "username, password, check_message",
+        [
+            # TC_LOGIN_002 - Invalid username, valid password
+            ("invaliduser@example.com", "TestPassword123!", True),
+            # TC_LOGIN_003 - Valid username, invalid password
+            ("testuser@example.com", "WrongPassword123!", True),
+            # TC_LOGIN_004 - Empty credentials (client-side validation may keep the form)
+            ("", "", False),
+        ],
+        ids=["invalid_username", "invalid_password", "empty_credentials"]
+    )
+    def test_login_with_invalid_credentials(self, request, username, password, check_message):
+        """
+        Test Cases: TC_LOGIN_002/003/004 - Login with Invalid or Empty Credentials
+        
+        Preconditions:
+            - User is on login page
+            
+        Test Steps:
+            1. Navigate to login page
+            2. Enter the given username and password
+            3. Click login button
+            
+        Expected Result:
+            - Login should fail
+            - Error message should be displayed (for empty credentials,
+              a validation message or the login form is acceptable)
+        """
+        case = request.node.callspec.id
+        try:
+            # Act
+            self.navigate_to_app(self.login_page)
+            assert self.login_page.is_login_page_displayed(), \
+                "Login page is not displayed"
+            
+            self.login_page.login(username, password)
+            
+            # Assert
+            self.wait_for_loading_to_complete()
+            if check_message:
+                assert self.login_page.is_error_message_displayed(), \
+                    "Error message is not displayed"
+                
+                error_msg = self.login_page.get_error_message()
+                assert "invalid" in error_msg.lower() or "failed" in error_msg.lower(), \
+                    f"Unexpected error message: {error_msg}"
+            else:
+                # Check for validation or error message
+                assert self.login_page.is_error_message_displayed() or \
+                       self.login_page.is_login_page_displayed(), \
+                    "Expected error or validation message"
+            
+            self.logger.info(f"✓ Test passed: {case} handled correctly")
+            
+        except AssertionError as e:
+            self.logger.error(f"✗ Test failed: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"✗ Test error: {str(e)}")
+            raise
+    
+    @pytest.mark.ui
+    @pytest.mark.smoke
+    def test_login_page_elements(self):
+        """
+        Test Case: TC_LOGIN_005 - Verify Login Page Elements
+        
+        Preconditions:
+            - User is on login page
+            
+        Test Steps:
+            1. Navigate to login page
+            2. Verify all required elements are present and visible
+            
+        Expected Result:
+            - All login page elements should be visible and functional
+        """
+        try:
+            # Act
+            self.navigate_to_app(self.login_page)
+            
+            # Assert
+            assert self.login_page.is_login_page_displayed(), \
+                "Login page is not displayed"
+            
+            # Check all elements in one round-trip
+            elements = {
+                "Username input field": self.locators.USERNAME_INPUT,
+                "Password input field": self.locators.PASSWORD_INPUT,
+                "Login button": self.locators.LOGIN_BUTTON,
+                "Forgot Password link": self.locators.FORGOT_PASSWORD_LINK,
+                "Sign Up link": self.locators.SIGNUP_LINK,
+            }
+            visibility = self.login_page.batch_is_displayed(list(elements.values()))
+            
+            for name, is_visible in zip(elements, visibility):
+                assert is_visible, f"{name} is not visible"
+            
+            self.logger.info("✓ Test passed: All login page elements are visible")
+            
+        except AssertionError as e:
+            self.logger.error(f"✗ Test failed: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"✗ Test error: {str(e)}")
+            raise
+    
+    @pytest.mark.login
+    @pytest.mark.regression
+    def test_login_with_remember_me(self, valid_creds):
+        """
+        Test Case: TC_LOGIN_006 - Login with Remember Me Checked
+        
+        Preconditions:
+            - User is on login page
+            
+        Test Steps:
+            1. Navigate to login page
+            2. Enter valid username and password
+            3. Check 'Remember Me' checkbox
+            4. Click login button
+            
+        Expected Result:
+            - Login should be successful
+            - Remember Me preference should be saved
+        """
+        try:
+            # Arrange
+            username, password = valid_creds
+            
+            # Act
+            self.navigate_to_app(self.login_page)
+            assert self.login_page.is_login_page_displayed(), \
+                "Login page is not displayed"
+            
+            self.login_page.login(username, password, remember_me=True)
+            
+            # Assert
+            self.wait_for_loading_to_complete()
+            assert self.login_page.is_remember_me_checked(), \
+                "Remember Me checkbox is not checked"
+            
+            self.assert_url_contains("dashboard")
+            
+            self.logger.info("✓ Test passed: Login with Remember Me successful")
+            
+        except AssertionError as e:
+            self.logger.error(f"✗ Test failed: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"✗ Test error: {str(e)}")
+            raise
+
+
+class TestLoginPageValidation(BaseTest):
+    """
+    Test class for login page validation and UI tests
+    """
+    
+    @pytest.fixture(autouse=True)
+    def setup_validation_tests(self):
+        """Setup for validation tests"""
+        self.login_page = LoginPage(self.driver)
+        yield
+    
+    @pytest.mark.ui
+    @pytest.mark.smoke
+    def test_username_field_placeholder(self):
+        """
+        Test Case: TC_LOGIN_007 - Verify Username Field Placeholder
+        
+        Expected Result:
+            - Username field should have proper placeholder text
+        """
+        try:
+            self.navigate_to_app(self.login_page)
+            
+            placeholder = self.login_page.get_username_placeholder()
+            assert placeholder is not None, "Username placeholder is missing"
+            assert len(placeholder) > 0, "Username placeholder is empty"
+            
+            self.logger.info(f"✓ Test passed: Username placeholder: {placeholder}")
+            
+        except AssertionError as e:
+            self.logger.error(f"✗ Test failed: {str(e)}")
+            raise
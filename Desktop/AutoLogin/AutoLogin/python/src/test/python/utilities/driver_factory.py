@@ -4,16 +4,27 @@ Creates and manages WebDriver instances for Chrome and Firefox browsers
 Supports headless mode and configuration via properties
 """
 
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 from utilities.logger_config import LoggerConfig
-from config.config_reader import ConfigReader
+from config.config_reader import get_config
+
+
+# Vendor capabilities turning off grid-side recording and log capture.
+# Unknown vendor prefixes are ignored by other grids, so all are sent.
+GRID_LEAN_CAPABILITIES = {
+    # LambdaTest
+    'lt:options': {'visual': False, 'network': False, 'console': False, 'video': False},
+    # BrowserStack
+    'bstack:options': {'debug': False, 'networkLogs': False, 'consoleLogs': 'disable', 'video': False},
+    # Sauce Labs
+    'sauce:options': {'recordVideo': False, 'recordScreenshots': False, 'recordLogs': False},
+}
 
 
 class DriverFactory:
@@ -21,13 +32,47 @@ class DriverFactory:
     Factory class for WebDriver creation.
     Supports Chrome and Firefox browsers with configuration options.
     Uses webdriver-manager for automatic driver management.
+    
+    webdriver-manager and the browser Service classes are imported only
+    when a driver of that browser is created, keeping module import cheap
+    for test collection (repeated on every pytest-xdist worker).
     """
     
     logger = LoggerConfig.get_logger(__name__)
-    config = ConfigReader()
+    config = get_config()
+    
+    # Serializes webdriver-manager installs so concurrent callers don't race
+    # on the same driver download
+    _install_lock = threading.Lock()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve_chrome_path():
+        """
+        Resolve the chromedriver binary once per process
+        
+        Returns:
+            str: Path to chromedriver installed by webdriver-manager
+        """
+        from webdriver_manager.chrome import ChromeDriverManager
+        with DriverFactory._install_lock:
+            return ChromeDriverManager().install()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve_firefox_path():
+        """
+        Resolve the geckodriver binary once per process
+        
+        Returns:
+            str: Path to geckodriver installed by webdriver-manager
+        """
+        from webdriver_manager.firefox import GeckoDriverManager
+        with DriverFactory._install_lock:
+            return GeckoDriverManager().install()
     
     @staticmethod
-    def create_driver(browser_name=None, headless=None):
+    def create_driver(browser_name=None, headless=None, user_data_dir=None, disk_cache_dir=None):
         """
         Create WebDriver instance based on browser name and configuration
         
@@ -36,6 +81,12 @@ class DriverFactory:
                                If None, reads from config.
             headless (bool): Run browser in headless mode. 
                             If None, reads from config.
+            user_data_dir (str): Chrome profile directory. Give each parallel
+                                 worker its own to avoid profile contention.
+                                 Ignored when running on a grid.
+            disk_cache_dir (str): Chrome HTTP cache directory, may outlive the
+                                  profile so static assets are reused across runs.
+                                  Ignored when running on a grid.
                             
         Returns:
             WebDriver: Configured WebDriver instance
@@ -48,37 +99,182 @@ class DriverFactory:
         
         DriverFactory.logger.info(f"Creating {browser} WebDriver (headless={is_headless})")
         
-        if browser == 'chrome':
-            return DriverFactory._create_chrome_driver(is_headless)
-        elif browser == 'firefox':
-            return DriverFactory._create_firefox_driver(is_headless)
-        else:
+        if browser not in ('chrome', 'firefox'):
             raise ValueError(f"Unsupported browser: {browser}")
+        
+        grid_url = DriverFactory.config.get_grid_url()
+        if grid_url:
+            return DriverFactory._create_remote_driver(browser, is_headless, grid_url)
+        
+        if browser == 'chrome':
+            return DriverFactory._create_chrome_driver(is_headless, user_data_dir, disk_cache_dir)
+        return DriverFactory._create_firefox_driver(is_headless)
     
     @staticmethod
-    def _create_chrome_driver(headless=False):
+    def create_drivers(count, browser_name=None, headless=None):
         """
-        Create Chrome WebDriver with option settings
+        Launch several WebDriver instances concurrently
+        
+        Browser startup dominates driver creation, so starting them in
+        parallel takes about as long as starting one. The driver binary is
+        resolved once up front so the threads don't race on installing it.
+        
+        Args:
+            count (int): Number of drivers to create
+            browser_name (str): Browser type ('chrome' or 'firefox'). 
+                               If None, reads from config.
+            headless (bool): Run browsers in headless mode. 
+                            If None, reads from config.
+            
+        Returns:
+            list: WebDriver instances (each with its own temporary profile)
+        """
+        browser = (browser_name or DriverFactory.config.get_browser()).lower()
+        if not DriverFactory.config.get_grid_url():
+            if browser == 'chrome':
+                DriverFactory._resolve_chrome_path()
+            elif browser == 'firefox':
+                DriverFactory._resolve_firefox_path()
+        
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(
+                lambda _: DriverFactory.create_driver(browser, headless),
+                range(count)
+            ))
+    
+    @staticmethod
+    def _build_chrome_options(headless=False, user_data_dir=None, disk_cache_dir=None):
+        """
+        Build Chrome options from configuration
         
         Args:
             headless (bool): Run in headless mode
+            user_data_dir (str): Chrome profile directory (None = temporary profile)
+            disk_cache_dir (str): Chrome HTTP cache directory (None = inside the profile)
             
         Returns:
-            WebDriver: Chrome WebDriver instance
+            ChromeOptions: Configured options
+        """
+        chrome_options = ChromeOptions()
+        
+        # Common arguments
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        
+        # Skip browser features tests never assert on
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-default-apps')
+        chrome_options.add_argument('--metrics-recording-only')
+        chrome_options.add_argument('--mute-audio')
+        
+        prefs = {'profile.default_content_setting_values.notifications': 2}
+        if DriverFactory.config.get_disable_images():
+            prefs['profile.managed_default_content_settings.images'] = 2
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option('prefs', prefs)
+        
+        if headless:
+            chrome_options.add_argument('--headless=new')
+        
+        if user_data_dir:
+            chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+        if disk_cache_dir:
+            # The HTTP cache lives outside the profile, so repeat navigations
+            # (and later runs) load CSS/JS from disk without keeping cookies
+            chrome_options.add_argument(f'--disk-cache-dir={disk_cache_dir}')
+        
+        chrome_options.page_load_strategy = DriverFactory.config.get_page_load_strategy()
+        return chrome_options
+    
+    @staticmethod
+    def _build_firefox_options(headless=False):
+        """
+        Build Firefox options from configuration
+        
+        Args:
+            headless (bool): Run in headless mode
+            
+        Returns:
+            FirefoxOptions: Configured options
+        """
+        firefox_options = FirefoxOptions()
+        
+        if headless:
+            firefox_options.add_argument('--headless')
+        
+        # Additional preferences
+        firefox_options.set_preference('dom.webdriver.enabled', False)
+        firefox_options.set_preference('permissions.default.desktop-notification', 2)
+        if DriverFactory.config.get_disable_images():
+            firefox_options.set_preference('permissions.default.image', 2)
+        
+        firefox_options.page_load_strategy = DriverFactory.config.get_page_load_strategy()
+        return firefox_options
+    
+    @staticmethod
+    def _create_remote_driver(browser, headless, grid_url):
+        """
+        Create a Remote WebDriver on a Selenium Grid / cloud grid
+        
+        Grid-side recording (video, screenshots, console and network logs)
+        is switched off through the vendor capabilities in
+        GRID_LEAN_CAPABILITIES, since it slows down every command.
+        
+        Args:
+            browser (str): 'chrome' or 'firefox'
+            headless (bool): Run in headless mode
+            grid_url (str): Grid hub URL
+            
+        Returns:
+            WebDriver: Remote WebDriver instance
         """
         try:
-            chrome_options = ChromeOptions()
+            if browser == 'chrome':
+                options = DriverFactory._build_chrome_options(headless)
+            else:
+                options = DriverFactory._build_firefox_options(headless)
+            
+            for name, value in GRID_LEAN_CAPABILITIES.items():
+                options.set_capability(name, value)
             
-            # Common arguments
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+            driver = webdriver.Remote(command_executor=grid_url, options=options)
+            
+            implicit_wait = DriverFactory.config.get_implicit_wait()
+            if implicit_wait:
+                driver.implicitly_wait(implicit_wait)
             
-            if headless:
-                chrome_options.add_argument('--headless=new')
+            driver.maximize_window()
+            
+            DriverFactory.logger.info(f"Remote {browser} WebDriver created on {grid_url}")
+            return driver
+            
+        except Exception as e:
+            DriverFactory.logger.error(f"Error creating Remote WebDriver: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _create_chrome_driver(headless=False, user_data_dir=None, disk_cache_dir=None):
+        """
+        Create Chrome WebDriver with option settings
+        
+        Args:
+            headless (bool): Run in headless mode
+            user_data_dir (str): Chrome profile directory (None = temporary profile)
+            disk_cache_dir (str): Chrome HTTP cache directory (None = inside the profile)
+            
+        Returns:
+            WebDriver: Chrome WebDriver instance
+        """
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        
+        try:
+            chrome_options = DriverFactory._build_chrome_options(headless, user_data_dir, disk_cache_dir)
             
             # Create service with webdriver-manager
-            service = ChromeService(ChromeDriverManager().install())
+            service = ChromeService(DriverFactory._resolve_chrome_path())
             
             # Create driver
             driver = webdriver.Chrome(
@@ -86,9 +282,14 @@ class DriverFactory:
                 options=chrome_options
             )
             
-            # Set implicit wait
+            # Implicit wait stays at the driver default (0) unless configured;
+            # page objects rely on explicit waits
             implicit_wait = DriverFactory.config.get_implicit_wait()
-            driver.implicitly_wait(implicit_wait)
+            if implicit_wait:
+                driver.implicitly_wait(implicit_wait)
+            
+            # Make sure DevTools has not left the HTTP cache disabled
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
             
             # Maximize window
             driver.maximize_window()
@@ -111,17 +312,13 @@ class DriverFactory:
         Returns:
             WebDriver: Firefox WebDriver instance
         """
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        
         try:
-            firefox_options = FirefoxOptions()
-            
-            if headless:
-                firefox_options.add_argument('--headless')
-            
-            # Additional preferences
-            firefox_options.set_preference('dom.webdriver.enabled', False)
+            firefox_options = DriverFactory._build_firefox_options(headless)
             
             # Create service with webdriver-manager
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(DriverFactory._resolve_firefox_path())
             
             # Create driver
             driver = webdriver.Firefox(
@@ -129,9 +326,11 @@ class DriverFactory:
                 options=firefox_options
             )
             
-            # Set implicit wait
+            # Implicit wait stays at the driver default (0) unless configured;
+            # page objects rely on explicit waits
             implicit_wait = DriverFactory.config.get_implicit_wait()
-            driver.implicitly_wait(implicit_wait)
+            if implicit_wait:
+                driver.implicitly_wait(implicit_wait)
             
             # Maximize window
             driver.maximize_window()
@@ -143,6 +342,31 @@ class DriverFactory:
             DriverFactory.logger.error(f"Error creating Firefox WebDriver: {str(e)}")
             raise
     
+    @staticmethod
+    def reset_driver(driver):
+        """
+        Reset browser state so a shared driver can be reused by the next test
+        
+        Clears cookies and web storage, then loads about:blank. The HTTP cache
+        is kept on purpose so static assets are not re-downloaded per test.
+        
+        delete_all_cookies() only reaches the origin currently loaded, so on
+        Chrome every cookie of the browser is cleared through CDP instead.
+        
+        Args:
+            driver: WebDriver instance to reset
+        """
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            driver.delete_all_cookies()
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception as e:
+            # Storage is not accessible on some pages (about:blank, data: URLs)
+            DriverFactory.logger.debug(f"Could not clear web storage: {str(e)}")
+        driver.get("about:blank")
+    
     @staticmethod
     def quit_driver(driver):
         """
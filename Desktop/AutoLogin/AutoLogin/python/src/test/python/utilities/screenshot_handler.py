@@ -3,10 +3,37 @@ Screenshot Handler Module
 Handles screenshot capture on test failures and general diagnostics
 """
 
+import os
+import bisect
+import heapq
+import time
 from pathlib import Path
-from datetime import datetime
 from utilities.logger_config import LoggerConfig
-from config.config_reader import ConfigReader
+from config.config_reader import get_config
+
+
+def _timestamp(millis=False):
+    """
+    Format the current local time for screenshot file names
+    
+    Builds the string from time.localtime() fields directly, which is cheaper
+    than creating a datetime and calling strftime.
+    
+    Args:
+        millis (bool): Append milliseconds (YYYYMMDD_HHMMSS_mmm)
+        
+    Returns:
+        str: Timestamp as YYYYMMDD_HHMMSS, optionally with _mmm
+    """
+    now = time.time()
+    lt = time.localtime(now)
+    stamp = (
+        f"{lt.tm_year}{lt.tm_mon:02d}{lt.tm_mday:02d}_"
+        f"{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}"
+    )
+    if millis:
+        stamp = f"{stamp}_{int(now % 1 * 1000):03d}"
+    return stamp
 
 
 class ScreenshotHandler:
@@ -16,7 +43,11 @@ class ScreenshotHandler:
     """
     
     logger = LoggerConfig.get_logger(__name__)
-    config = ConfigReader()
+    config = get_config()
+    
+    # Resolved directory -> (directory mtime_ns, sorted (mtime, path) list),
+    # shared by every handler so per-test handlers reuse one scan
+    _indexes = {}
     
     def __init__(self, screenshot_dir=None):
         """
@@ -28,7 +59,75 @@ class ScreenshotHandler:
         """
         self.screenshot_dir = Path(screenshot_dir or self.config.get_screenshot_path())
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.debug(f"Screenshot directory: {self.screenshot_dir}")
+        self._index_key = str(self.screenshot_dir.resolve())
+        self.logger.debug("Screenshot directory: %s", self.screenshot_dir)
+    
+    def _dir_stamp(self):
+        """Get the screenshot directory's mtime (changes when files are added or removed)"""
+        return os.stat(self.screenshot_dir).st_mtime_ns
+    
+    def _current_index(self):
+        """
+        Get the shared index if the directory has not changed since it was built
+        
+        Returns:
+            list: (mtime, path) tuples sorted oldest first, or None if stale/missing
+        """
+        entry = ScreenshotHandler._indexes.get(self._index_key)
+        if entry is not None and entry[0] == self._dir_stamp():
+            return entry[1]
+        return None
+    
+    def _index(self):
+        """
+        Get the screenshot index, rescanning when the directory has changed
+        
+        Files written or deleted by other handlers, the failure hook or other
+        xdist workers change the directory mtime, so they are always seen.
+        
+        Returns:
+            list: (mtime, path) tuples sorted oldest first
+        """
+        screenshots = self._current_index()
+        if screenshots is None:
+            # Stamp taken before scanning, so a write during the scan forces a rescan
+            stamp = self._dir_stamp()
+            screenshots = sorted(self._scan())
+            ScreenshotHandler._indexes[self._index_key] = (stamp, screenshots)
+        return screenshots
+    
+    def _scan(self):
+        """
+        List screenshots in a single directory pass
+        
+        Returns:
+            list: Unsorted (mtime, path) tuples
+        """
+        with os.scandir(self.screenshot_dir) as entries:
+            return [
+                (entry.stat().st_mtime, entry.path)
+                for entry in entries
+                if entry.name.endswith('.png') and entry.is_file(follow_symlinks=False)
+            ]
+    
+    def _remember_overwrite(self, path):
+        """
+        Move an overwritten screenshot to its new position in the index
+        
+        A new file changes the directory mtime, so the next read rescans; an
+        overwrite (custom filename) does not, so its entry is updated here.
+        
+        Args:
+            path (str): Screenshot file path
+        """
+        screenshots = self._current_index()
+        if screenshots is None:
+            return
+        for position, (_, known_path) in enumerate(screenshots):
+            if known_path == path:
+                del screenshots[position]
+                break
+        bisect.insort(screenshots, (os.stat(path).st_mtime, path))
     
     def capture_screenshot(self, driver, filename=None, test_name=None):
         """
@@ -47,8 +146,9 @@ class ScreenshotHandler:
             Exception: If screenshot capture fails
         """
         try:
-            if filename is None:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+            custom_name = filename is not None
+            if not custom_name:
+                timestamp = _timestamp(millis=True)
                 if test_name:
                     filename = f"{test_name}_{timestamp}.png"
                 else:
@@ -56,12 +156,14 @@ class ScreenshotHandler:
             
             screenshot_path = self.screenshot_dir / filename
             driver.save_screenshot(str(screenshot_path))
+            if custom_name:
+                self._remember_overwrite(str(screenshot_path))
             
-            self.logger.info(f"Screenshot saved: {screenshot_path}")
+            self.logger.info("Screenshot saved: %s", screenshot_path)
             return str(screenshot_path)
             
         except Exception as e:
-            self.logger.error(f"Error capturing screenshot: {str(e)}")
+            self.logger.error("Error capturing screenshot: %s", e)
             raise
     
     def capture_screenshot_on_failure(self, driver, test_name):
@@ -75,10 +177,10 @@ class ScreenshotHandler:
         Returns:
             str: Full path to failure screenshot
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = _timestamp()
         filename = f"FAILURE_{test_name}_{timestamp}.png"
         
-        self.logger.warning(f"Test failed, capturing screenshot: {test_name}")
+        self.logger.warning("Test failed, capturing screenshot: %s", test_name)
         return self.capture_screenshot(driver, filename)
     
     def get_latest_screenshot(self):
@@ -89,16 +191,12 @@ class ScreenshotHandler:
             str: Path to latest screenshot file or None if no screenshots
         """
         try:
-            screenshots = sorted(
-                self.screenshot_dir.glob('*.png'),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
+            screenshots = self._index()
             if screenshots:
-                return str(screenshots[0])
+                return screenshots[-1][1]
             return None
         except Exception as e:
-            self.logger.error(f"Error getting latest screenshot: {str(e)}")
+            self.logger.error("Error getting latest screenshot: %s", e)
             return None
     
     def cleanup_old_screenshots(self, keep_count=50):
@@ -109,16 +207,20 @@ class ScreenshotHandler:
             keep_count (int): Number of recent screenshots to keep
         """
         try:
-            screenshots = sorted(
-                self.screenshot_dir.glob('*.png'),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
+            # Without a current index, select only the oldest files instead of sorting all
+            indexed = self._current_index()
+            screenshots = indexed if indexed is not None else self._scan()
+            excess = len(screenshots) - keep_count
             
-            if len(screenshots) > keep_count:
-                for screenshot in screenshots[keep_count:]:
-                    screenshot.unlink()
-                    self.logger.debug(f"Deleted old screenshot: {screenshot}")
+            if excess > 0:
+                # Deleting changes the directory mtime, so the index is rebuilt on next use
+                if indexed is not None:
+                    oldest = indexed[:excess]
+                else:
+                    oldest = heapq.nsmallest(excess, screenshots)
+                for _, screenshot in oldest:
+                    Path(screenshot).unlink(missing_ok=True)
+                    self.logger.debug("Deleted old screenshot: %s", screenshot)
                     
         except Exception as e:
-            self.logger.error(f"Error cleaning up screenshots: {str(e)}")
+            self.logger.error("Error cleaning up screenshots: %s", e)
@@ -4,7 +4,44 @@ Abstract base class for page actions
 Provides structure for creating action classes for other pages
 """
 
+import functools
 from pages.base_pages.base_page import BasePage
+from utilities.smart_find import SmartFind
+
+
+def log_action(message, error_message=None):
+    """
+    Decorator logging the outcome of a page action
+    
+    Logs message on success; on failure logs error_message with the exception
+    and re-raises, replacing the try/log/raise block in every action method.
+    
+    Args:
+        message (str): Message logged (INFO) when the action succeeds
+        error_message (str): Message logged (ERROR) on failure.
+                             Defaults to "Error in <function name>".
+        
+    Example:
+        @log_action("Clicked logout button", "Error logging out")
+        def logout(self):
+            self.click_element(self.locators.LOGOUT_BUTTON)
+    """
+    def decorator(func):
+        failure_message = error_message or f"Error in {func.__name__}"
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                result = func(self, *args, **kwargs)
+            except Exception as e:
+                self.logger.error("%s: %s", failure_message, e)
+                raise
+            self.logger.info(message)
+            return result
+        
+        return wrapper
+    
+    return decorator
 
 
 class BaseActions(BasePage):
@@ -24,13 +61,18 @@ class BaseActions(BasePage):
         class YourPageActions(BaseActions):
             def __init__(self, driver):
                 super().__init__(driver)
-                self.locators = YourPageLocators()
+                self.set_locators(YourPageLocators())
             
             def your_action(self):
                 # Use self.locators to access page elements
                 self.click_element(self.locators.BUTTON)
+    
+    Subclasses declare __slots__ (empty unless they add instance attributes)
+    so page objects stay free of a per-instance __dict__.
     """
     
+    __slots__ = ("locators",)
+    
     def __init__(self, driver):
         """Initialize BaseActions with WebDriver instance"""
         super().__init__(driver)
@@ -38,13 +80,14 @@ class BaseActions(BasePage):
     
     def set_locators(self, locators):
         """
-        Set locators for this page
+        Set locators for this page and register their fallback patterns
         
         Args:
             locators: Locators class instance
         """
         self.locators = locators
-        self.logger.debug(f"Locators set: {locators.__class__.__name__}")
+        SmartFind.register(locators)
+        self.logger.debug("Locators set: %s", locators.__class__.__name__)
     
     def get_page_name(self):
         """
@@ -3,12 +3,209 @@ BasePage Module
 Base class for all page objects following Page Object Model (POM) pattern
 """
 
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import re
+import time
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    WebDriverException
+)
 from utilities.wait_helper import WaitHelper
+from utilities.smart_find import SmartFind
 from utilities.logger_config import LoggerConfig
 
 
+# JS expressions resolving the first element matched by each locator strategy.
+# '{0}' is replaced with the JSON-encoded locator value.
+_JS_RESOLVERS = {
+    By.ID: "document.getElementById({0})",
+    By.NAME: "document.getElementsByName({0})[0]",
+    By.CLASS_NAME: "document.getElementsByClassName({0})[0]",
+    By.TAG_NAME: "document.getElementsByTagName({0})[0]",
+    By.CSS_SELECTOR: "document.querySelector({0})",
+    By.XPATH: "document.evaluate({0}, document, null, "
+              "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue",
+    By.LINK_TEXT: "Array.prototype.find.call(document.getElementsByTagName('a'), "
+                  "function (a) { return a.textContent.trim() === {0}; })",
+    By.PARTIAL_LINK_TEXT: "Array.prototype.find.call(document.getElementsByTagName('a'), "
+                          "function (a) { return a.textContent.indexOf({0}) !== -1; })",
+}
+
+# Mirrors WebElement.is_displayed(): rendered with a box and not hidden by CSS
+_JS_IS_VISIBLE = (
+    "var isVisible = function (el) {"
+    " return !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)"
+    " && window.getComputedStyle(el).visibility !== 'hidden'; };"
+)
+
+# Sets an input's value the way typing would be observed by page scripts.
+# The nearest 'value' setter on the prototype chain is used so controlled inputs
+# (React etc.), customized built-ins and custom elements see the change.
+# setValue returns false when there is no setter (e.g. contenteditable hosts),
+# so callers can fall back to typing.
+_JS_SET_VALUE = (
+    "var valueSetter = function (el) {"
+    " for (var proto = Object.getPrototypeOf(el); proto; proto = Object.getPrototypeOf(proto)) {"
+    " var descriptor = Object.getOwnPropertyDescriptor(proto, 'value');"
+    " if (descriptor) { return descriptor.set || null; } }"
+    " return null; };"
+    " var setValue = function (el, value) {"
+    " var setter = valueSetter(el);"
+    " if (!setter) { return false; }"
+    " setter.call(el, value);"
+    " el.dispatchEvent(new Event('input', {bubbles: true}));"
+    " el.dispatchEvent(new Event('change', {bubbles: true}));"
+    " return true; };"
+)
+
+# arguments[0] = element, arguments[1] = text; returns false if no value setter
+_SET_VALUE_SCRIPT = f"{_JS_SET_VALUE} arguments[0].focus(); return setValue(arguments[0], arguments[1]);"
+
+# _fill_and_submit_script result when a field has no value setter (nothing was changed)
+_FILL_NEEDS_TYPING = -2
+
+# Marker set on the current document before a CDP navigation; the new
+# document is ready once the marker is gone and the DOM has been parsed
+_MARK_DOCUMENT_SCRIPT = "window.__autoLoginPreviousDocument = true;"
+_NEW_DOCUMENT_READY_SCRIPT = (
+    "return !window.__autoLoginPreviousDocument && document.readyState !== 'loading';"
+)
+
+
+@functools.cache
+def _action_chains():
+    """Import ActionChains on first use; most tests never hover or double click"""
+    from selenium.webdriver.common.action_chains import ActionChains
+    return ActionChains
+
+
+@functools.cache
+def _select_cls():
+    """Import Select on first use; only dropdown helpers need it"""
+    from selenium.webdriver.support.select import Select
+    return Select
+
+
+# Seconds between click attempts while an element is not yet interactable
+_CLICK_RETRY_INTERVAL = 0.1
+
+# Simple XPath forms with an exact CSS equivalent: //tag[@attr='value'] or //*[@attr='value']
+_SIMPLE_XPATH = re.compile(r"""^//(\*|[A-Za-z][\w-]*)\[@(id|class|name)=(['"])([^'"]*)\3\]$""")
+_CSS_IDENTIFIER = re.compile(r"^[A-Za-z_][\w-]*$")
+
+
+@functools.lru_cache(maxsize=None)
+def _to_js(locator):
+    """
+    Convert a Selenium locator tuple into a JS expression resolving the element
+    
+    Locators are class-level constants, so each one is converted only once.
+    
+    Args:
+        locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+        
+    Returns:
+        str: JS expression evaluating to the element or null/undefined
+        
+    Raises:
+        ValueError: If locator strategy is not supported
+    """
+    by, value = locator
+    if by not in _JS_RESOLVERS:
+        raise ValueError(f"Unsupported locator strategy for JS lookup: {by}")
+    # Python-side replace instead of str.format() since templates contain JS braces
+    return _JS_RESOLVERS[by].replace("{0}", json.dumps(value))
+
+
+@functools.lru_cache(maxsize=None)
+def _visibility_script(locators):
+    """
+    Build (once per locator tuple) the script returning visibility flags
+    
+    Args:
+        locators (tuple): Tuple of Selenium locator tuples
+        
+    Returns:
+        str: Script returning a list of booleans
+    """
+    checks = ", ".join(f"isVisible({_to_js(locator)})" for locator in locators)
+    return f"{_JS_IS_VISIBLE} return [{checks}];"
+
+
+@functools.lru_cache(maxsize=None)
+def _element_ready_script(locator):
+    """
+    Build (once per locator) the script checking that a CDP navigation landed
+    on a new document containing the element
+    
+    Args:
+        locator (tuple): Selenium locator tuple of the element to wait for
+        
+    Returns:
+        str: Script returning true once the element exists in the new document
+    """
+    return f"return !window.__autoLoginPreviousDocument && !!({_to_js(locator)});"
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_get_script(spec):
+    """
+    Build (once per spec) the script reading text/attributes of several elements
+    
+    Args:
+        spec (tuple): Tuple of (locator, property) pairs; property "text"
+                      reads innerText, anything else is an attribute name
+        
+    Returns:
+        str: Script returning a list of strings (null for missing elements)
+    """
+    reads = ", ".join(
+        f"read({_to_js(locator)}, {json.dumps(prop)})" for locator, prop in spec
+    )
+    return (
+        "var read = function (el, prop) {"
+        " if (!el) { return null; }"
+        " return prop === 'text' ? el.innerText : el.getAttribute(prop); };"
+        f" return [{reads}];"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _fill_and_submit_script(locators):
+    """
+    Build (once per locator tuple) the script filling inputs then clicking submit
+    
+    The last locator is the submit element. The script returns the index of the
+    first unresolved locator, _FILL_NEEDS_TYPING if a field has no value setter
+    (before anything is changed), or -1 on success.
+    
+    Args:
+        locators (tuple): Tuple of Selenium locator tuples
+        
+    Returns:
+        str: Script expecting the input values as arguments
+    """
+    resolvers = ", ".join(_to_js(locator) for locator in locators)
+    return (
+        f"{_JS_SET_VALUE} var values = arguments;"
+        f" var elements = [{resolvers}];"
+        " for (var i = 0; i < elements.length; i++) { if (!elements[i]) { return i; } }"
+        " var submit = elements.pop();"
+        f" if (!elements.every(valueSetter)) {{ return {_FILL_NEEDS_TYPING}; }}"
+        " elements.forEach(function (el, i) { setValue(el, values[i]); });"
+        " submit.click();"
+        " return -1;"
+    )
+
+
 class BasePage:
     """
     Base class for all page objects.
@@ -21,6 +218,24 @@ class BasePage:
     - Logging
     """
     
+    # No per-instance __dict__: page objects are created per test/step
+    __slots__ = ("driver", "_wait_helper", "smart_find", "logger", "_element_cache", "_debug_on")
+    
+    # Page class -> logger, so re-instantiating page objects skips logger setup
+    _logger_cache = {}
+    
+    # Run per-element checks concurrently when the batched JS check is unavailable.
+    # Disable for drivers that don't accept concurrent commands on one session.
+    PARALLEL_CHECKS = True
+    
+    # Navigate/reload through Chrome DevTools when available, continuing as soon
+    # as the DOM is interactive instead of waiting for the full load event
+    CDP_NAVIGATION = True
+    
+    # Clear inputs before typing on the native send_keys path. Off by default to
+    # save a WebDriver call per input; clear explicitly when a field is prefilled.
+    ALWAYS_CLEAR = False
+    
     def __init__(self, driver):
         """
         Initialize BasePage with WebDriver instance
@@ -29,9 +244,206 @@ class BasePage:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.wait_helper = WaitHelper(driver)
-        self.logger = LoggerConfig.get_logger(self.__class__.__name__)
-        self.logger.debug(f"Initializing {self.__class__.__name__}")
+        self._wait_helper = None
+        self.smart_find = SmartFind(driver)
+        self.logger = self._get_class_logger()
+        self._element_cache = {}
+        self.refresh_log_level()
+        self.logger.debug("Initializing %s", self.__class__.__name__)
+    
+    @classmethod
+    def _get_class_logger(cls):
+        """
+        Get the logger for this page class, creating it on first use
+        
+        Returns:
+            logging.Logger: Logger shared by all instances of the class
+        """
+        logger = BasePage._logger_cache.get(cls)
+        if logger is None:
+            logger = BasePage._logger_cache[cls] = LoggerConfig.get_logger(cls.__name__)
+        return logger
+    
+    @property
+    def wait_helper(self):
+        """WaitHelper for this page, created on first wait"""
+        if self._wait_helper is None:
+            self._wait_helper = WaitHelper(self.driver)
+        return self._wait_helper
+    
+    def refresh_log_level(self):
+        """
+        Re-read whether DEBUG logging is enabled
+        
+        The flag is cached so the hot is_element_* checks skip debug calls
+        entirely; call this after changing the logger level at runtime.
+        """
+        self._debug_on = self.logger.isEnabledFor(logging.DEBUG)
+    
+    # Shared across instances: XPath -> CSS rewrites are pure and page independent
+    _normalized_locators = {}
+    
+    # ==================== Element Cache ====================
+    
+    def _normalize_locator(self, locator):
+        """
+        Rewrite simple attribute XPath locators to the equivalent CSS selector
+        
+        CSS lookups are cheaper than XPath evaluation in the browser. Only
+        exact-match id/class/name predicates are rewritten; anything else is
+        returned unchanged.
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            
+        Returns:
+            tuple: Equivalent (By.CSS_SELECTOR, selector) tuple or the original locator
+        """
+        cached = BasePage._normalized_locators.get(locator)
+        if cached is not None:
+            return cached
+        
+        normalized = locator
+        by, value = locator
+        match = _SIMPLE_XPATH.match(value) if by == By.XPATH else None
+        if match:
+            tag, attribute, _, attr_value = match.groups()
+            tag = "" if tag == "*" else tag
+            if attribute == "id" and _CSS_IDENTIFIER.match(attr_value):
+                selector = f"{tag}#{attr_value}"
+            else:
+                selector = f"{tag}[{attribute}={json.dumps(attr_value, ensure_ascii=False)}]"
+            normalized = (By.CSS_SELECTOR, selector)
+            self.logger.debug("Rewrote locator %s -> %s", locator, normalized)
+        
+        BasePage._normalized_locators[locator] = normalized
+        return normalized
+    
+    def _resolve(self, locator, waiter):
+        """
+        Return the cached element for locator, resolving it with waiter on a miss
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            waiter (callable): WaitHelper method used to locate the element
+            
+        Returns:
+            WebElement: Resolved element
+        """
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = waiter(locator)
+            self._element_cache[locator] = element
+        return element
+    
+    def _with_element(self, locator, waiter, action):
+        """
+        Run action on the (cached) element, re-resolving once if it went stale
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            waiter (callable): WaitHelper method used to locate the element
+            action (callable): Callable receiving the WebElement
+            
+        Returns:
+            Value returned by action
+        """
+        locator = self._normalize_locator(locator)
+        try:
+            return action(self._resolve(locator, waiter))
+        except StaleElementReferenceException:
+            self.logger.debug("Stale cached element, re-resolving: %s", locator)
+            self._element_cache.pop(locator, None)
+            return action(self._resolve(locator, waiter))
+    
+    def _with_healing(self, locator, waiter, action):
+        """
+        Run action on the element, healing the locator once if it times out
+        
+        Uses a previously healed locator when one is cached. On timeout, the
+        locator's fallback pattern (see SmartFind) is walked and the action
+        retried once with the locator that matched.
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            waiter (callable): WaitHelper method used to locate the element
+            action (callable): Callable receiving the WebElement
+            
+        Returns:
+            Value returned by action
+        """
+        locator = self.smart_find.locator_for(locator)
+        try:
+            return self._with_element(locator, waiter, action)
+        except TimeoutException:
+            healed_locator = self.smart_find.heal(locator)
+            if healed_locator is None:
+                raise
+            return self._with_element(healed_locator, waiter, action)
+    
+    def _find_now(self, locator):
+        """
+        Look up matching elements once, without polling
+        
+        find_elements never raises NoSuchElementException and, with implicit
+        wait disabled, returns immediately.
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            
+        Returns:
+            list: Matching WebElements (empty if none)
+        """
+        return self.driver.find_elements(*self._normalize_locator(locator))
+    
+    def _element_state(self, locator, wait, getter):
+        """
+        Read a state flag from the first matching element
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            wait (bool): Wait for presence first instead of checking once
+            getter (callable): Callable receiving the WebElement, returning bool
+            
+        Returns:
+            bool: Value of getter, or False if no element matches (wait=False)
+        """
+        if wait:
+            return self._with_element(locator, self.wait_helper.wait_for_element_present, getter)
+        elements = self._find_now(locator)
+        if not elements:
+            return False
+        # Keep the element for follow-up actions (e.g. reading text after a check)
+        self._element_cache[self._normalize_locator(locator)] = elements[0]
+        return getter(elements[0])
+    
+    def _click_when_ready(self, element):
+        """
+        Click element, retrying while it is covered or not yet interactable
+        
+        element.click() fails fast when the element can't receive the click, so
+        retrying it replaces polling the clickable condition before clicking.
+        
+        Args:
+            element: WebElement to click
+            
+        Raises:
+            ElementClickInterceptedException: If still covered after explicit wait
+            ElementNotInteractableException: If still not interactable after explicit wait
+        """
+        deadline = time.monotonic() + self.wait_helper.wait_time
+        while True:
+            try:
+                element.click()
+                return
+            except (ElementClickInterceptedException, ElementNotInteractableException):
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(_CLICK_RETRY_INTERVAL)
+    
+    def invalidate_cache(self):
+        """Drop all cached elements (call after the page changes)"""
+        self._element_cache.clear()
     
     # ==================== Element Interaction Methods ====================
     
@@ -39,32 +451,58 @@ class BasePage:
         """
         Click on element using Actions or direct click
         
+        Waits for presence only, then retries the click itself until the
+        element accepts it (stale elements are re-resolved).
+        
         Args:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
         """
         try:
-            element = self.wait_helper.wait_for_element_clickable(locator)
-            element.click()
-            self.logger.info(f"Clicked element: {locator}")
+            self._with_healing(
+                locator,
+                self.wait_helper.wait_for_element_present,
+                self._click_when_ready
+            )
+            self.logger.info("Clicked element: %s", locator)
         except Exception as e:
-            self.logger.error(f"Error clicking element {locator}: {str(e)}")
+            self.logger.error("Error clicking element %s: %s", locator, e)
             raise
     
-    def send_keys(self, locator, text):
+    def send_keys(self, locator, text, native=False):
         """
         Send text input to element
         
+        By default the value is set with one script call on the (cached)
+        element, replacing any existing value without a separate clear.
+        
         Args:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
             text (str): Text to send
+            native (bool): Type real keystrokes with send_keys() instead, for inputs
+                           that depend on key events (masks, autocomplete). The field
+                           is only cleared first when ALWAYS_CLEAR is set.
         """
         try:
-            element = self.wait_helper.wait_for_element_visible(locator)
-            element.clear()
-            element.send_keys(text)
-            self.logger.info(f"Sent keys to element {locator}: {text[:20]}...")
+            def clear_and_type(element):
+                if self.ALWAYS_CLEAR:
+                    element.clear()
+                element.send_keys(text)
+            
+            def set_value(element):
+                # No value setter (e.g. contenteditable host): type into it instead
+                if not self.driver.execute_script(_SET_VALUE_SCRIPT, element, text):
+                    element.clear()
+                    element.send_keys(text)
+            
+            self._with_healing(
+                locator,
+                self.wait_helper.wait_for_element_visible,
+                clear_and_type if native else set_value
+            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Sent keys to element %s: %s...", locator, text[:20])
         except Exception as e:
-            self.logger.error(f"Error sending keys to {locator}: {str(e)}")
+            self.logger.error("Error sending keys to %s: %s", locator, e)
             raise
     
     def get_element_text(self, locator):
@@ -78,12 +516,15 @@ class BasePage:
             str: Element text content
         """
         try:
-            element = self.wait_helper.wait_for_element_visible(locator)
-            text = element.text
-            self.logger.debug(f"Got text from element {locator}: {text}")
+            text = self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_visible,
+                lambda element: element.text
+            )
+            self.logger.debug("Got text from element %s: %s", locator, text)
             return text
         except Exception as e:
-            self.logger.error(f"Error getting text from {locator}: {str(e)}")
+            self.logger.error("Error getting text from %s: %s", locator, e)
             raise
     
     def get_element_attribute(self, locator, attribute):
@@ -98,71 +539,254 @@ class BasePage:
             str: Attribute value
         """
         try:
-            element = self.wait_helper.wait_for_element_present(locator)
-            attr_value = element.get_attribute(attribute)
-            self.logger.debug(f"Got attribute '{attribute}' from element {locator}: {attr_value}")
+            attr_value = self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_present,
+                lambda element: element.get_attribute(attribute)
+            )
+            self.logger.debug("Got attribute '%s' from element %s: %s", attribute, locator, attr_value)
             return attr_value
         except Exception as e:
-            self.logger.error(f"Error getting attribute '{attribute}' from {locator}: {str(e)}")
+            self.logger.error("Error getting attribute '%s' from %s: %s", attribute, locator, e)
             raise
     
-    def is_element_displayed(self, locator):
+    def is_element_displayed(self, locator, wait=False, timeout=None):
         """
         Check if element is displayed on page
         
         Args:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            wait (bool): Poll until the element is present (up to explicit wait).
+                         Default False checks once, so negative checks return fast.
+            timeout (int): Instead, wait up to this many seconds for visibility,
+                           for elements that appear shortly after an action
             
         Returns:
             bool: True if element is displayed
         """
         try:
-            element = self.wait_helper.wait_for_element_present(locator)
-            is_displayed = element.is_displayed()
-            self.logger.debug(f"Element {locator} displayed: {is_displayed}")
+            if timeout is not None:
+                normalized = self._normalize_locator(locator)
+                self._element_cache[normalized] = self.wait_helper.wait_for(normalized, timeout)
+                is_displayed = True
+            else:
+                is_displayed = self._element_state(locator, wait, lambda element: element.is_displayed())
+            if self._debug_on:
+                self.logger.debug("Element %s displayed: %s", locator, is_displayed)
             return is_displayed
         except Exception as e:
-            self.logger.debug(f"Element {locator} not displayed: {str(e)}")
+            if self._debug_on:
+                self.logger.debug("Element %s not displayed: %s", locator, e)
             return False
     
-    def is_element_enabled(self, locator):
+    def is_element_enabled(self, locator, wait=False):
         """
         Check if element is enabled
         
         Args:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            wait (bool): Poll until the element is present (up to explicit wait).
+                         Default False checks once, so negative checks return fast.
             
         Returns:
             bool: True if element is enabled
         """
         try:
-            element = self.wait_helper.wait_for_element_present(locator)
-            is_enabled = element.is_enabled()
-            self.logger.debug(f"Element {locator} enabled: {is_enabled}")
+            is_enabled = self._element_state(locator, wait, lambda element: element.is_enabled())
+            if self._debug_on:
+                self.logger.debug("Element %s enabled: %s", locator, is_enabled)
             return is_enabled
         except Exception as e:
-            self.logger.debug(f"Error checking if element enabled {locator}: {str(e)}")
+            if self._debug_on:
+                self.logger.debug("Error checking if element enabled %s: %s", locator, e)
             return False
     
-    def is_element_selected(self, locator):
+    def is_element_selected(self, locator, wait=False):
         """
         Check if element is selected (for checkboxes/radio buttons)
         
         Args:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            wait (bool): Poll until the element is present (up to explicit wait).
+                         Default False checks once, so negative checks return fast.
             
         Returns:
             bool: True if element is selected
         """
         try:
-            element = self.wait_helper.wait_for_element_present(locator)
-            is_selected = element.is_selected()
-            self.logger.debug(f"Element {locator} selected: {is_selected}")
+            is_selected = self._element_state(locator, wait, lambda element: element.is_selected())
+            if self._debug_on:
+                self.logger.debug("Element %s selected: %s", locator, is_selected)
             return is_selected
         except Exception as e:
-            self.logger.debug(f"Error checking if element selected {locator}: {str(e)}")
+            if self._debug_on:
+                self.logger.debug("Error checking if element selected %s: %s", locator, e)
             return False
     
+    # ==================== Batched Query Methods ====================
+    
+    def _visibility_flags(self, locators):
+        """
+        Run the batched visibility script for the given locators as-is
+        
+        Args:
+            locators (tuple): Tuple of Selenium locator tuples
+            
+        Returns:
+            list: Visibility flag (bool) for each locator, in the same order
+        """
+        return [bool(result) for result in self.driver.execute_script(_visibility_script(locators))]
+    
+    def batch_is_displayed(self, locators, heal=True):
+        """
+        Check visibility of several elements in a single WebDriver round-trip
+        
+        Uses previously healed locators when cached. With heal, the fallback
+        pattern (see SmartFind) of each locator that is not visible is walked,
+        and if any of them heal the batch is checked once more.
+        
+        Args:
+            locators (list): List of Selenium locator tuples
+            heal (bool): Heal locators that are not visible. Pollers pass False
+                         and heal only once their wait times out.
+            
+        Returns:
+            list: Visibility flag (bool) for each locator, in the same order
+        """
+        locators = tuple(self.smart_find.locator_for(locator) for locator in locators)
+        results = self._visibility_flags(locators)
+        
+        if heal and not all(results):
+            healed = [
+                None if visible else self.smart_find.heal(locator)
+                for locator, visible in zip(locators, results)
+            ]
+            if any(healed):
+                locators = tuple(new or old for new, old in zip(healed, locators))
+                results = self._visibility_flags(locators)
+        
+        if self._debug_on:
+            self.logger.debug("Batch visibility for %s: %s", locators, results)
+        return results
+    
+    def parallel_is_displayed(self, locators):
+        """
+        Check visibility of several elements concurrently, one thread per locator
+        
+        Fallback for drivers without DOM/JS support, where batch_is_displayed
+        cannot be used; each check waits up to the explicit wait.
+        
+        Args:
+            locators (list): List of Selenium locator tuples
+            
+        Returns:
+            list: Visibility flag (bool) for each locator, in the same order
+        """
+        with ThreadPoolExecutor(max_workers=len(locators)) as executor:
+            return list(executor.map(
+                lambda locator: self.is_element_displayed(locator, wait=True),
+                locators
+            ))
+    
+    def batch_get(self, spec):
+        """
+        Read text or attributes of several elements in a single WebDriver round-trip
+        
+        Args:
+            spec (list): List of (locator, property) pairs. Property "text"
+                         returns the element's visible text, any other value
+                         is read as an attribute.
+            
+        Returns:
+            list: Values in spec order (None where the element is missing)
+        """
+        spec = tuple((self.smart_find.locator_for(locator), prop) for locator, prop in spec)
+        values = self.driver.execute_script(_batch_get_script(spec))
+        
+        # None is also a missing attribute; only heal locators that match nothing
+        healed = [
+            self.smart_find.heal(locator) if value is None and not self._find_now(locator) else None
+            for (locator, _), value in zip(spec, values)
+        ]
+        if any(healed):
+            spec = tuple((new or locator, prop) for new, (locator, prop) in zip(healed, spec))
+            values = self.driver.execute_script(_batch_get_script(spec))
+        
+        self.logger.debug("Batch read %s: %s", spec, values)
+        return values
+    
+    def fill_and_submit(self, fields, submit_locator):
+        """
+        Fill several inputs and click submit in a single WebDriver round-trip
+        
+        Values are passed as script arguments (never interpolated into JS) and
+        'input'/'change' events are dispatched so framework bindings update.
+        Cached healed locators are used, and a locator the script cannot resolve
+        is healed and the script re-run; nothing is changed until every
+        locator resolves.
+        
+        Args:
+            fields (dict): Mapping of locator tuple -> text to enter
+            submit_locator (tuple): Locator of the element to click afterwards
+            
+        Raises:
+            NoSuchElementException: If any field or the submit element is missing
+        """
+        locators = [self.smart_find.locator_for(locator) for locator in (*fields, submit_locator)]
+        healed = set()
+        while True:
+            missing = self.driver.execute_script(
+                _fill_and_submit_script(tuple(locators)),
+                *fields.values()
+            )
+            if missing < 0 or missing in healed:
+                break
+            healed_locator = self.smart_find.heal(locators[missing])
+            if healed_locator is None:
+                break
+            healed.add(missing)
+            locators[missing] = healed_locator
+        
+        if missing == _FILL_NEEDS_TYPING:
+            self.logger.debug("Field without value setter, filling step by step: %s", list(fields))
+            for locator, text in fields.items():
+                self.send_keys(locator, text)
+            self.click_element(submit_locator)
+            return
+        if missing != -1:
+            raise NoSuchElementException(f"Element not found: {locators[missing]}")
+        self.logger.info("Filled %s field(s) and clicked: %s", len(fields), submit_locator)
+    
+    def are_elements_displayed(self, locators, timeout=None):
+        """
+        Wait until all elements are displayed, polling with one batched query
+        
+        Polling uses cached healed locators only; when the wait times out the
+        locators that are still not visible are healed and checked once more.
+        If the driver can't run the batched script (no DOM), each element is
+        checked on its own, concurrently when PARALLEL_CHECKS is set.
+        
+        Args:
+            locators (list): List of Selenium locator tuples
+            timeout (int): Custom timeout in seconds
+            
+        Returns:
+            bool: True if all elements became visible within timeout
+        """
+        try:
+            return self.wait_helper.wait_for_condition(
+                lambda driver: all(self.batch_is_displayed(locators, heal=False)),
+                timeout,
+                f"elements displayed: {locators}"
+            )
+        except TimeoutException:
+            return all(self.batch_is_displayed(locators))
+        except WebDriverException as e:
+            self.logger.debug("Batched visibility check unavailable, checking elements individually: %s", e)
+            if self.PARALLEL_CHECKS and len(locators) > 1:
+                return all(self.parallel_is_displayed(locators))
+            return all(self.is_element_displayed(locator, wait=True) for locator in locators)
+    
     # ==================== Advanced Interaction Methods ====================
     
     def hover_over_element(self, locator):
@@ -173,12 +797,14 @@ class BasePage:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
         """
         try:
-            element = self.wait_helper.wait_for_element_visible(locator)
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element).perform()
-            self.logger.info(f"Hovered over element: {locator}")
+            self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_visible,
+                lambda element: _action_chains()(self.driver).move_to_element(element).perform()
+            )
+            self.logger.info("Hovered over element: %s", locator)
         except Exception as e:
-            self.logger.error(f"Error hovering over element {locator}: {str(e)}")
+            self.logger.error("Error hovering over element %s: %s", locator, e)
             raise
     
     def double_click_element(self, locator):
@@ -189,12 +815,14 @@ class BasePage:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
         """
         try:
-            element = self.wait_helper.wait_for_element_clickable(locator)
-            actions = ActionChains(self.driver)
-            actions.double_click(element).perform()
-            self.logger.info(f"Double clicked element: {locator}")
+            self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_clickable,
+                lambda element: _action_chains()(self.driver).double_click(element).perform()
+            )
+            self.logger.info("Double clicked element: %s", locator)
         except Exception as e:
-            self.logger.error(f"Error double clicking element {locator}: {str(e)}")
+            self.logger.error("Error double clicking element %s: %s", locator, e)
             raise
     
     def right_click_element(self, locator):
@@ -205,12 +833,14 @@ class BasePage:
             locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
         """
         try:
-            element = self.wait_helper.wait_for_element_visible(locator)
-            actions = ActionChains(self.driver)
-            actions.context_click(element).perform()
-            self.logger.info(f"Right clicked element: {locator}")
+            self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_visible,
+                lambda element: _action_chains()(self.driver).context_click(element).perform()
+            )
+            self.logger.info("Right clicked element: %s", locator)
         except Exception as e:
-            self.logger.error(f"Error right clicking element {locator}: {str(e)}")
+            self.logger.error("Error right clicking element %s: %s", locator, e)
             raise
     
     def select_dropdown_by_text(self, locator, text):
@@ -222,13 +852,14 @@ class BasePage:
             text (str): Visible text of option
         """
         try:
-            from selenium.webdriver.support.select import Select
-            element = self.wait_helper.wait_for_element_visible(locator)
-            select = Select(element)
-            select.select_by_visible_text(text)
-            self.logger.info(f"Selected dropdown option '{text}' in element: {locator}")
+            self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_visible,
+                lambda element: _select_cls()(element).select_by_visible_text(text)
+            )
+            self.logger.info("Selected dropdown option '%s' in element: %s", text, locator)
         except Exception as e:
-            self.logger.error(f"Error selecting dropdown option '{text}' in {locator}: {str(e)}")
+            self.logger.error("Error selecting dropdown option '%s' in %s: %s", text, locator, e)
             raise
     
     def select_dropdown_by_value(self, locator, value):
@@ -240,56 +871,115 @@ class BasePage:
             value (str): Value attribute of option
         """
         try:
-            from selenium.webdriver.support.select import Select
-            element = self.wait_helper.wait_for_element_visible(locator)
-            select = Select(element)
-            select.select_by_value(value)
-            self.logger.info(f"Selected dropdown option with value '{value}' in element: {locator}")
+            self._with_element(
+                locator,
+                self.wait_helper.wait_for_element_visible,
+                lambda element: _select_cls()(element).select_by_value(value)
+            )
+            self.logger.info("Selected dropdown option with value '%s' in element: %s", value, locator)
         except Exception as e:
-            self.logger.error(f"Error selecting dropdown option '{value}' in {locator}: {str(e)}")
+            self.logger.error("Error selecting dropdown option '%s' in %s: %s", value, locator, e)
             raise
     
     # ==================== Navigation Methods ====================
     
-    def navigate_to(self, url):
+    def _uses_cdp(self):
+        """Check whether navigation should go through Chrome DevTools"""
+        return self.CDP_NAVIGATION and hasattr(self.driver, 'execute_cdp_cmd')
+    
+    def _cdp_navigate(self, command, params=None, ready_locator=None):
+        """
+        Run a CDP navigation command and wait until the new document is usable
+        
+        Args:
+            command (str): CDP command, 'Page.navigate' or 'Page.reload'
+            params (dict): Command parameters
+            ready_locator (tuple): Wait for this element in the new document
+                                   instead of for the DOM to be interactive
+            
+        Raises:
+            WebDriverException: If the browser reports a navigation error
+            TimeoutException: If the new document is not ready within explicit wait
+        """
+        self.driver.execute_script(_MARK_DOCUMENT_SCRIPT)
+        result = self.driver.execute_cdp_cmd(command, params or {}) or {}
+        if result.get('errorText'):
+            raise WebDriverException(f"Navigation failed: {result['errorText']}")
+        if command == 'Page.navigate' and not result.get('loaderId'):
+            # Same-document navigation (e.g. fragment change): nothing to wait for
+            return
+        
+        if ready_locator is not None:
+            script = _element_ready_script(self._normalize_locator(ready_locator))
+            description = f"element in new document: {ready_locator}"
+        else:
+            script = _NEW_DOCUMENT_READY_SCRIPT
+            description = "document interactive"
+        
+        def new_document_ready(driver):
+            try:
+                return driver.execute_script(script)
+            except WebDriverException:
+                # Script may fail while the old document is unloading
+                return False
+        
+        self.wait_helper.wait_for_condition(new_document_ready, description=description)
+    
+    def navigate_to(self, url, ready_locator=None):
         """
         Navigate to URL
         
+        Uses CDP Page.navigate on Chrome (see CDP_NAVIGATION), driver.get() otherwise.
+        
         Args:
             url (str): URL to navigate to
+            ready_locator (tuple): Element the page needs before it is usable;
+                                   waited for instead of the full page load
         """
         try:
-            self.driver.get(url)
-            self.logger.info(f"Navigated to: {url}")
+            if self._uses_cdp():
+                self._cdp_navigate('Page.navigate', {'url': url}, ready_locator)
+            else:
+                self.driver.get(url)
+                if ready_locator is not None:
+                    self.wait_helper.wait_for_element_present(self._normalize_locator(ready_locator))
+            self.invalidate_cache()
+            self.logger.info("Navigated to: %s", url)
         except Exception as e:
-            self.logger.error(f"Error navigating to {url}: {str(e)}")
+            self.logger.error("Error navigating to %s: %s", url, e)
             raise
     
     def refresh_page(self):
         """Refresh current page"""
         try:
-            self.driver.refresh()
+            if self._uses_cdp():
+                self._cdp_navigate('Page.reload')
+            else:
+                self.driver.refresh()
+            self.invalidate_cache()
             self.logger.info("Page refreshed")
         except Exception as e:
-            self.logger.error(f"Error refreshing page: {str(e)}")
+            self.logger.error("Error refreshing page: %s", e)
             raise
     
     def go_back(self):
         """Go back to previous page"""
         try:
             self.driver.back()
+            self.invalidate_cache()
             self.logger.info("Navigated back")
         except Exception as e:
-            self.logger.error(f"Error navigating back: {str(e)}")
+            self.logger.error("Error navigating back: %s", e)
             raise
     
     def go_forward(self):
         """Go forward to next page"""
         try:
             self.driver.forward()
+            self.invalidate_cache()
             self.logger.info("Navigated forward")
         except Exception as e:
-            self.logger.error(f"Error navigating forward: {str(e)}")
+            self.logger.error("Error navigating forward: %s", e)
             raise
     
     # ==================== Page State Methods ====================
@@ -303,10 +993,10 @@ class BasePage:
         """
         try:
             title = self.driver.title
-            self.logger.debug(f"Got page title: {title}")
+            self.logger.debug("Got page title: %s", title)
             return title
         except Exception as e:
-            self.logger.error(f"Error getting page title: {str(e)}")
+            self.logger.error("Error getting page title: %s", e)
             raise
     
     def get_current_url(self):
@@ -318,10 +1008,10 @@ class BasePage:
         """
         try:
             url = self.driver.current_url
-            self.logger.debug(f"Got current URL: {url}")
+            self.logger.debug("Got current URL: %s", url)
             return url
         except Exception as e:
-            self.logger.error(f"Error getting current URL: {str(e)}")
+            self.logger.error("Error getting current URL: %s", e)
             raise
     
     def wait_for_page_title(self, title_text):
@@ -340,10 +1030,15 @@ class BasePage:
         """
         Wait for URL to contain text
         
+        Cached elements belong to the previous page once the URL changes, so
+        the element cache is dropped after a successful wait.
+        
         Args:
             url_text (str): Text that should be in URL
             
         Returns:
             bool: True when URL contains text
         """
-        return self.wait_helper.wait_for_url_contains(url_text)
+        result = self.wait_helper.wait_for_url_contains(url_text)
+        self.invalidate_cache()
+        return result
@@ -20,8 +20,10 @@ class DashboardPage(DashboardActions):
     Follows Page Object Model pattern with separated locators and actions.
     """
     
+    __slots__ = ()
+    
     def __init__(self, driver):
         """Initialize DashboardPage with WebDriver instance"""
         super().__init__(driver)
         # Make locators accessible as class attributes for backward compatibility
-        self.locators = DashboardLocators()
+        self.set_locators(DashboardLocators())
@@ -16,8 +16,10 @@ class LoginPage(LoginActions):
     Follows Page Object Model pattern with separated locators and actions.
     """
     
+    __slots__ = ()
+    
     def __init__(self, driver):
         """Initialize LoginPage with WebDriver instance"""
         super().__init__(driver)
         # Make locators accessible as class attributes for backward compatibility
-        self.locators = LoginLocators()
+        self.set_locators(LoginLocators())
@@ -5,45 +5,67 @@ Example page demonstrating the locators structure
 """
 
 from selenium.webdriver.common.by import By
-from pages.locators.base_locators import BaseLocators
+from pages.locators.base_locators import BaseLocators, Locator
 
 
 class DashboardLocators(BaseLocators):
     """
     Locators for dashboard page.
     This is an example showing how to structure locators for other pages.
+    
+    ID and class locators are written as CSS selectors so they can be combined
+    into one query with get_css_batch(); link text and text-matching XPath
+    locators have no CSS equivalent and stay as they are.
     """
     
     # ==================== Header Elements ====================
     # User profile button
-    USER_PROFILE_BUTTON = (By.ID, "user-profile")
+    USER_PROFILE_BUTTON = Locator(By.CSS_SELECTOR, "#user-profile")
     
     # Logout button
-    LOGOUT_BUTTON = (By.XPATH, "//button[contains(text(), 'Logout')]")
+    LOGOUT_BUTTON = Locator(By.XPATH, "//button[contains(text(), 'Logout')]")
     
     # Welcome message
-    WELCOME_MESSAGE = (By.CLASS_NAME, "welcome-text")
+    WELCOME_MESSAGE = Locator(By.CSS_SELECTOR, ".welcome-text")
     
     # ==================== Navigation ====================
     # Sidebar menu
-    SIDEBAR_MENU = (By.ID, "sidebar-menu")
+    SIDEBAR_MENU = Locator(By.CSS_SELECTOR, "#sidebar-menu")
     
     # Dashboard link
-    DASHBOARD_LINK = (By.LINK_TEXT, "Dashboard")
+    DASHBOARD_LINK = Locator(By.LINK_TEXT, "Dashboard")
     
     # Settings link
-    SETTINGS_LINK = (By.LINK_TEXT, "Settings")
+    SETTINGS_LINK = Locator(By.LINK_TEXT, "Settings")
     
     # ==================== Content Area ====================
     # Main content area
-    MAIN_CONTENT = (By.ID, "main-content")
+    MAIN_CONTENT = Locator(By.CSS_SELECTOR, "#main-content")
     
     # Data table
-    DATA_TABLE = (By.ID, "data-table")
+    DATA_TABLE = Locator(By.CSS_SELECTOR, "#data-table")
     
     # ==================== Notifications ====================
     # Notification bell
-    NOTIFICATION_BELL = (By.CLASS_NAME, "notification-bell")
+    NOTIFICATION_BELL = Locator(By.CSS_SELECTOR, ".notification-bell")
     
     # Notification badge
-    NOTIFICATION_BADGE = (By.CLASS_NAME, "notification-badge")
+    NOTIFICATION_BADGE = Locator(By.CSS_SELECTOR, ".notification-badge")
+    
+    # ==================== Self-Healing Fallbacks ====================
+    # Alternatives tried in order when a primary locator stops matching
+    FALLBACKS = {
+        'LOGOUT_BUTTON': [
+            (By.CSS_SELECTOR, "[data-testid='logout-button']"),
+            (By.CSS_SELECTOR, "button[aria-label='Logout']"),
+            (By.XPATH, "//*[self::button or self::a][contains(normalize-space(), 'Log out')]"),
+        ],
+        'USER_PROFILE_BUTTON': [
+            (By.CSS_SELECTOR, "[data-testid='user-profile']"),
+            (By.CSS_SELECTOR, "[aria-label='User profile']"),
+        ],
+        'SETTINGS_LINK': [
+            (By.CSS_SELECTOR, "[data-testid='settings-link']"),
+            (By.CSS_SELECTOR, "a[href*='settings']"),
+        ],
+    }
@@ -3,42 +3,96 @@ Logger Configuration Module
 Configures logging for the test framework with file and console handlers
 """
 
+import os
+import atexit
+import queue
 import logging
 import logging.handlers
+import threading
 from pathlib import Path
 from datetime import datetime
 
 
+# Guards one-time logger creation (page checks may run in worker threads)
+_logger_lock = threading.Lock()
+
+# The framework logger, created on first get_logger() call
+_logger = None
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size itself
+    
+    The stock handler formats every record twice (once to measure it in
+    shouldRollover) and checks the file on each emit; this one formats once
+    and keeps a running byte count, touching the file system only on rollover.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._current_size = os.path.getsize(self.baseFilename) if os.path.isfile(self.baseFilename) else 0
+    
+    def emit(self, record):
+        """
+        Write the record, rolling over first if it would exceed maxBytes
+        
+        Args:
+            record (logging.LogRecord): Record to write
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or 'utf-8'))
+            if self.maxBytes > 0 and self._current_size and self._current_size + size >= self.maxBytes:
+                self.doRollover()
+                self._current_size = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._current_size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class LoggerConfig:
     """
     Configures and manages logging for the framework.
     Provides centralized logging to console and file.
+    
+    Records are handed to a background QueueListener, so console output and
+    log file writes/rollover checks run off the test thread. Formatting still
+    happens on the calling thread: QueueHandler.prepare() interpolates the
+    message and renders any traceback before queueing the record.
     """
     
-    _logger = None
+    _listener = None
     
     @staticmethod
-    def get_logger(name=None, log_level=logging.INFO, log_dir='./logs'):
+    def _create_logger(name, log_level, log_dir):
         """
-        Get or create a logger instance
+        Create the framework logger with console and rotating file handlers
         
         Args:
-            name (str): Logger name (typically __name__)
-            log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            name (str): Logger name
+            log_level: Logging level
             log_dir (str): Directory to store log files
             
         Returns:
             logging.Logger: Configured logger instance
         """
-        if LoggerConfig._logger is not None:
-            return LoggerConfig._logger
-        
         # Create logs directory if it doesn't exist
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
         
+        # pytest-xdist sets PYTEST_XDIST_WORKER (gw0, gw1, ...) in each worker process;
+        # tag logger and file with it so parallel workers don't share a log file
+        worker_id = LoggerConfig.get_worker_id()
+        
         # Create logger instance
-        logger = logging.getLogger(name or 'AutoLogin')
+        logger = logging.getLogger(f"{name or 'AutoLogin'}.{worker_id}")
         logger.setLevel(log_level)
         
         # Remove existing handlers to avoid duplicates
@@ -54,25 +108,79 @@ class LoggerConfig:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
         
         # File Handler with rotation
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = log_path / f'automation_test_{timestamp}.log'
+        log_file = log_path / f'automation_test_{worker_id}_{timestamp}.log'
         
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             filename=str(log_file),
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
         
-        LoggerConfig._logger = logger
+        # The logger only enqueues; the listener thread runs both handlers
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        LoggerConfig._listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        LoggerConfig._listener.start()
+        
         return logger
     
+    @staticmethod
+    def get_worker_id():
+        """
+        Get the pytest-xdist worker id of the current process
+        
+        Returns:
+            str: Worker id (gw0, gw1, ...) or 'master' when not running under xdist
+        """
+        return os.environ.get('PYTEST_XDIST_WORKER', 'master')
+    
+    @staticmethod
+    def stop_listener():
+        """Flush queued records and stop the background log writer"""
+        listener, LoggerConfig._listener = LoggerConfig._listener, None
+        if listener is not None:
+            listener.stop()
+    
     @staticmethod
     def reset_logger():
         """Reset logger instance (useful for testing)"""
-        LoggerConfig._logger = None
+        global _logger
+        LoggerConfig.stop_listener()
+        _logger = None
+
+
+def get_logger(name=None, log_level=logging.INFO, log_dir='./logs'):
+    """
+    Get or create the framework logger
+    
+    Args:
+        name (str): Logger name (typically __name__)
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_dir (str): Directory to store log files
+        
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    global _logger
+    if _logger is not None:
+        return _logger
+    
+    with _logger_lock:
+        if _logger is None:
+            _logger = LoggerConfig._create_logger(name, log_level, log_dir)
+    return _logger
+
+
+# Kept for existing LoggerConfig.get_logger(...) callers
+LoggerConfig.get_logger = staticmethod(get_logger)
+
+
+# Write out records still queued when the process exits
+atexit.register(LoggerConfig.stop_listener)
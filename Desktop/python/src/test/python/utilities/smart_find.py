@@ -0,0 +1,210 @@
+"""
+Smart Find Module
+Self-healing locator resolution with a persistent cache of healed selectors
+"""
+
+import json
+import os
+from pathlib import Path
+from utilities.logger_config import LoggerConfig
+from config.config_reader import get_config
+
+
+class SmartFind:
+    """
+    Resolves page elements through per-locator fallback chains.
+    
+    Each locator registered from a locators class gets a pattern: its primary
+    locator followed by the class' FALLBACKS for that name (typically
+    test id -> aria -> css -> text). When the primary locator stops matching,
+    only that entry is re-resolved by walking its pattern, and the locator that
+    worked is written to a JSON cache so later lookups (and later runs) use it
+    directly instead of timing out again.
+    """
+    
+    logger = LoggerConfig.get_logger(__name__)
+    config = get_config()
+    
+    # "LoginLocators.LOGIN_BUTTON" -> [primary locator, fallback, ...]
+    PATTERNS = {}
+    
+    # primary locator tuple -> pattern name
+    _names = {}
+    
+    # pattern name -> healed locator tuple, loaded lazily from the JSON cache
+    _healed = None
+    
+    def __init__(self, driver):
+        """
+        Initialize SmartFind with WebDriver instance
+        
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        self.driver = driver
+    
+    # ==================== Registry ====================
+    
+    @classmethod
+    def register(cls, locators):
+        """
+        Register fallback patterns for every locator of a locators class
+        
+        Args:
+            locators: Locators class or instance (BaseLocators subclass)
+        """
+        class_name = locators.__name__ if isinstance(locators, type) else locators.__class__.__name__
+        fallbacks = getattr(locators, 'FALLBACKS', {})
+        
+        for attr_name, primary in locators.get_all_locators().items():
+            name = f"{class_name}.{attr_name}"
+            cls.PATTERNS[name] = [primary] + [tuple(loc) for loc in fallbacks.get(attr_name, [])]
+            cls._names[primary] = name
+    
+    # ==================== Persistent Cache ====================
+    
+    @classmethod
+    def _cache_path(cls):
+        """Get path of the healed locator cache file"""
+        return Path(cls.config.get_locator_cache_path())
+    
+    @classmethod
+    def _read_cache_file(cls):
+        """
+        Read healed locators currently stored on disk
+        
+        Returns:
+            dict: Pattern name -> healed locator tuple (empty if missing/unreadable)
+        """
+        path = cls._cache_path()
+        if not path.exists():
+            return {}
+        try:
+            with open(path, encoding='utf-8') as cache_file:
+                return {
+                    name: tuple(locator)
+                    for name, locator in json.load(cache_file).items()
+                }
+        except (OSError, ValueError) as e:
+            cls.logger.warning("Ignoring unreadable locator cache %s: %s", path, e)
+            return {}
+    
+    @classmethod
+    def _load_cache(cls):
+        """
+        Load healed locators from disk once per process
+        
+        Returns:
+            dict: Pattern name -> healed locator tuple
+        """
+        if cls._healed is None:
+            cls._healed = cls._read_cache_file()
+            cls.logger.debug("Loaded %s healed locator(s) from %s", len(cls._healed), cls._cache_path())
+        return cls._healed
+    
+    @classmethod
+    def _save_heal(cls, name, locator):
+        """
+        Record one healed locator and write it to disk
+        
+        The file is re-read and merged right before the atomic replace, so
+        heals written by other workers since this process loaded the cache
+        are kept. Workers healing at the same instant can still race within
+        that read-merge-replace window; the replace itself never tears the file.
+        
+        Args:
+            name (str): Pattern name
+            locator (tuple): Locator that matched
+        """
+        healed = cls._load_cache()
+        healed.update(cls._read_cache_file())
+        healed[name] = locator
+        
+        path = cls._cache_path()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(
+                    {key: list(value) for key, value in healed.items()},
+                    cache_file,
+                    indent=2,
+                    sort_keys=True
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            cls.logger.warning("Could not write locator cache %s: %s", path, e)
+    
+    # ==================== Resolution ====================
+    
+    def locator_for(self, locator):
+        """
+        Get the locator to use for a lookup, preferring a previously healed one
+        
+        Args:
+            locator (tuple): Primary locator tuple
+        
+        Returns:
+            tuple: Healed locator if one is cached, otherwise the given locator
+        """
+        name = self._names.get(locator)
+        if name is None:
+            return locator
+        return self._load_cache().get(name, locator)
+    
+    def heal(self, failed_locator):
+        """
+        Re-resolve a locator that stopped matching by walking its pattern
+        
+        The first pattern locator that finds a displayed element replaces the
+        entry and is written back to disk. If nothing matches (e.g. a transient
+        timeout), the existing entry and the file are left untouched.
+        
+        Args:
+            failed_locator (tuple): Locator that timed out (primary or healed)
+        
+        Returns:
+            tuple: Working locator, or None if no pattern entry matches
+        """
+        name = self._names.get(failed_locator)
+        healed = self._load_cache()
+        if name is None:
+            # The failing locator may itself be a previously healed one
+            name = next((n for n, loc in healed.items() if loc == failed_locator), None)
+        if name is None or name not in self.PATTERNS:
+            return None
+        
+        for candidate in self.PATTERNS[name]:
+            if candidate == failed_locator:
+                continue
+            if any(element.is_displayed() for element in self.driver.find_elements(*candidate)):
+                self.logger.warning("Healed locator %s: %s -> %s", name, failed_locator, candidate)
+                self._save_heal(name, candidate)
+                return candidate
+        
+        self.logger.error("No working locator found for %s", name)
+        return None
+    
+    def resolve(self, name):
+        """
+        Find an element by pattern name, healing the entry if needed
+        
+        Args:
+            name (str): Pattern name, e.g. "LoginLocators.LOGIN_BUTTON"
+        
+        Returns:
+            WebElement: First element matched by the pattern, or None
+        """
+        pattern = self.PATTERNS.get(name)
+        if not pattern:
+            raise KeyError(f"No locator pattern registered for: {name}")
+        
+        locator = self._load_cache().get(name, pattern[0])
+        elements = self.driver.find_elements(*locator)
+        if elements:
+            return elements[0]
+        
+        healed_locator = self.heal(locator)
+        if healed_locator is None:
+            return None
+        return self.driver.find_elements(*healed_locator)[0]
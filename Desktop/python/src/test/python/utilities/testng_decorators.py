@@ -3,14 +3,26 @@ TestNG-Style Decorators and Annotations for Python
 Provides TestNG-like decorators for PyTest tests
 """
 
-import functools
+import inspect
+from collections import defaultdict
 from typing import List, Optional
+import pytest
 from utilities.logger_config import LoggerConfig
 
 
+# Module logger, resolved once at import
+_LOG = LoggerConfig.get_logger(__name__)
+
 # Global registry for test metadata
 test_registry = {}
 
+# Secondary indexes over test_registry, filled as tests register
+_group_index = defaultdict(list)
+_priority_index = defaultdict(list)
+
+# Priorities that have a matching pytest marker registered in pytest.ini
+PRIORITY_MARKERS = {1: 'priority1', 2: 'priority2', 3: 'priority3'}
+
 
 def test_method(
     name: Optional[str] = None,
@@ -42,44 +54,55 @@ def test_method(
         )
         def test_successful_login(self):
             pass
+    
+    The test function is returned unwrapped with the metadata attached as
+    attributes; disabled tests are skipped by the collection hook in conftest.py.
+    That hook also applies every group (and the priority, for priorities 1-3)
+    as a pytest marker, registering groups missing from pytest.ini first, so
+    `pytest -m smoke` selects the test without stacked @pytest.mark decorators
+    and --strict-markers never rejects a group.
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = LoggerConfig.get_logger(__name__)
-            
-            if not enabled:
-                logger.warning(f"Test {func.__name__} is disabled")
-                return None
-            
-            logger.info(f"Running: {description or func.__name__}")
-            return func(*args, **kwargs)
-        
-        # Store metadata
-        wrapper.test_name = name or func.__name__
-        wrapper.description = description or func.__doc__
-        wrapper.priority = priority
-        wrapper.groups = groups or []
-        wrapper.enabled = enabled
-        wrapper.timeout = timeout
-        wrapper.depends_on_methods = depends_on_methods or []
-        wrapper.is_test = True
-        
-        test_registry[func.__name__] = {
-            'name': wrapper.test_name,
-            'description': wrapper.description,
+        # Build the metadata once; the registry entry and the function share it
+        entry = {
+            'name': name or func.__name__,
+            'description': description or func.__doc__,
             'priority': priority,
-            'groups': wrapper.groups,
+            'groups': tuple(groups or ()),
             'enabled': enabled,
             'timeout': timeout,
-            'depends_on_methods': depends_on_methods
+            'depends_on_methods': tuple(depends_on_methods or ()),
+            'is_test': True
         }
-        
-        return wrapper
+        func.__dict__.update(entry, test_name=entry['name'])
+        _register(func.__name__, entry)
+        return func
     
     return decorator
 
 
+def marker_names(func) -> List[str]:
+    """
+    Get the pytest marker names implied by a @test_method function
+    
+    Markers are applied at collection (see conftest.py) rather than here, since
+    pytest rejects unregistered marker names at decoration time under
+    --strict-markers and groups are free-form.
+    
+    Args:
+        func: Test function
+        
+    Returns:
+        List of unique group names plus the priority marker (priorities 1-3)
+    """
+    if not getattr(func, 'is_test', False):
+        return []
+    names = list(func.groups)
+    if func.priority in PRIORITY_MARKERS:
+        names.append(PRIORITY_MARKERS[func.priority])
+    return list(dict.fromkeys(names))
+
+
 def before_method(alwaysRun: bool = False):
     """
     TestNG-style @BeforeMethod decorator
@@ -94,15 +117,10 @@ def before_method(alwaysRun: bool = False):
             pass
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = LoggerConfig.get_logger(__name__)
-            logger.debug(f"Before method: {func.__name__}")
-            return func(*args, **kwargs)
-        
-        wrapper.is_before_method = True
-        wrapper.always_run = alwaysRun
-        return wrapper
+        # Mark the function itself, no call-time wrapper
+        func.is_before_method = True
+        func.always_run = alwaysRun
+        return func
     
     return decorator
 
@@ -121,15 +139,10 @@ def after_method(alwaysRun: bool = False):
             pass
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = LoggerConfig.get_logger(__name__)
-            logger.debug(f"After method: {func.__name__}")
-            return func(*args, **kwargs)
-        
-        wrapper.is_after_method = True
-        wrapper.always_run = alwaysRun
-        return wrapper
+        # Mark the function itself, no call-time wrapper
+        func.is_after_method = True
+        func.always_run = alwaysRun
+        return func
     
     return decorator
 
@@ -148,15 +161,10 @@ def before_class(alwaysRun: bool = False):
             pass
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = LoggerConfig.get_logger(__name__)
-            logger.debug(f"Before class: {func.__name__}")
-            return func(*args, **kwargs)
-        
-        wrapper.is_before_class = True
-        wrapper.always_run = alwaysRun
-        return wrapper
+        # Mark the function itself, no call-time wrapper
+        func.is_before_class = True
+        func.always_run = alwaysRun
+        return func
     
     return decorator
 
@@ -175,15 +183,10 @@ def after_class(alwaysRun: bool = False):
             pass
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = LoggerConfig.get_logger(__name__)
-            logger.debug(f"After class: {func.__name__}")
-            return func(*args, **kwargs)
-        
-        wrapper.is_after_class = True
-        wrapper.always_run = alwaysRun
-        return wrapper
+        # Mark the function itself, no call-time wrapper
+        func.is_after_class = True
+        func.always_run = alwaysRun
+        return func
     
     return decorator
 
@@ -202,26 +205,26 @@ def skip(reason: str = "Skipped"):
             pass
     """
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            logger = LoggerConfig.get_logger(__name__)
-            logger.warning(f"Test skipped: {reason}")
-            return None
-        
-        wrapper.skip_reason = reason
-        wrapper.is_skipped = True
-        return wrapper
+        # pytest skips the test at collection, so no call-time wrapper is needed
+        func.skip_reason = reason
+        func.is_skipped = True
+        _LOG.debug("Test %s marked as skipped: %s", func.__name__, reason)
+        return pytest.mark.skip(reason=reason)(func)
     
     return decorator
 
 
-def data_provider(data_list: List):
+def data_provider(data_list: List, ids: Optional[List[str]] = None):
     """
     TestNG-style @DataProvider decorator
     Provides test data for parameterized tests
     
+    Expands to pytest.mark.parametrize at decoration time: each row is passed
+    to the test's parameters (after self) in order.
+    
     Args:
-        data_list: List of test data
+        data_list: List of test data rows (a single value per row is allowed)
+        ids: Optional test ids, one per row
         
     Example:
         @data_provider([
@@ -231,18 +234,40 @@ def data_provider(data_list: List):
         def test_login_with_data(self, username, password):
             pass
     """
+    rows = [tuple(row) if isinstance(row, (list, tuple)) else (row,) for row in data_list]
+    
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+        arg_count = len(rows[0]) if rows else 0
+        arg_names = [
+            param for param in inspect.signature(func).parameters
+            if param != 'self'
+        ][:arg_count]
+        
+        # pytest expects bare values (not 1-tuples) for a single parameter
+        arg_values = [row[0] for row in rows] if arg_count == 1 else rows
         
-        wrapper.test_data = data_list
-        wrapper.is_data_provider = True
-        return wrapper
+        func.test_data = data_list
+        func.is_data_provider = True
+        return pytest.mark.parametrize(','.join(arg_names), arg_values, ids=ids)(func)
     
     return decorator
 
 
+def _register(key: str, entry: dict):
+    """Store test metadata and index it by group and priority"""
+    previous = test_registry.get(key)
+    if previous is not None:
+        # Same function name registered again, drop the stale index entries
+        for group in dict.fromkeys(previous['groups']):
+            _group_index[group].remove(previous)
+        _priority_index[previous['priority']].remove(previous)
+    
+    test_registry[key] = entry
+    for group in dict.fromkeys(entry['groups']):
+        _group_index[group].append(entry)
+    _priority_index[entry['priority']].append(entry)
+
+
 def get_test_registry():
     """Get all registered tests"""
     return test_registry
@@ -258,10 +283,7 @@ def get_tests_by_group(group_name: str) -> List[dict]:
     Returns:
         List of tests in group
     """
-    return [
-        test for test in test_registry.values()
-        if group_name in test['groups']
-    ]
+    return list(_group_index.get(group_name, ()))
 
 
 def get_tests_by_priority(priority: int) -> List[dict]:
@@ -274,7 +296,4 @@ def get_tests_by_priority(priority: int) -> List[dict]:
     Returns:
         List of tests with that priority
     """
-    return [
-        test for test in test_registry.values()
-        if test['priority'] == priority
-    ]
+    return list(_priority_index.get(priority, ()))
@@ -5,86 +5,203 @@ Bridges TestNG XML configuration with PyTest execution
 """
 
 import xml.etree.ElementTree as ET
+import contextlib
+import os
 import subprocess
 import json
 from pathlib import Path
 from typing import List, Dict, Set
+import pytest
 from utilities.logger_config import LoggerConfig
 
 
+# Parsed testng.xml cache, relative to the XML file's directory
+PARSE_CACHE_FILE = Path('.pytest_cache') / 'testng_parsed.json'
+
+# Part of the cache key; bump when the parse output changes
+PARSE_CACHE_VERSION = 2
+
+# Directory pytest is run from (relative to the project root)
+TEST_ROOT = 'src/test/python'
+
+
+@contextlib.contextmanager
+def _chdir(path):
+    """Temporarily change the working directory"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
 class TestNGSuiteRunner:
     """
     Runs TestNG test suites using PyTest
     Reads TestNG XML configuration and executes tests accordingly
     """
     
-    def __init__(self, testng_xml_path: str = "testng.xml"):
+    def __init__(self, testng_xml_path: str = "testng.xml", isolated: bool = False):
         """
         Initialize TestNG Suite Runner
         
         Args:
             testng_xml_path: Path to testng.xml file
+            isolated: Run pytest in a subprocess instead of in-process
+                      (fresh interpreter per run, e.g. when running many suites
+                      whose modules must be re-imported)
         """
         self.logger = LoggerConfig.get_logger(__name__)
         self.xml_path = Path(testng_xml_path)
+        self.isolated = isolated
         self.test_suites = []
+        self._pytest_args_cache = {}
         self.parse_testng_xml()
     
     def parse_testng_xml(self):
-        """Parse TestNG XML configuration file"""
+        """
+        Parse TestNG XML configuration file
+        
+        Results are cached on disk keyed on the file path and modification
+        time, so repeated runner invocations skip XML parsing entirely.
+        """
         try:
             if not self.xml_path.exists():
                 self.logger.error(f"TestNG XML file not found: {self.xml_path}")
                 return
             
-            tree = ET.parse(self.xml_path)
-            root = tree.getroot()
-            
-            # Extract suite parameters
-            self.suite_parameters = {}
-            for param in root.findall('.//parameter'):
-                self.suite_parameters[param.get('name')] = param.get('value')
+            cache_key = f"v{PARSE_CACHE_VERSION}:{self.xml_path.resolve()}:{self.xml_path.stat().st_mtime_ns}"
+            cached = self._load_parse_cache().get(cache_key)
+            if cached is not None:
+                self.suite_parameters = cached['parameters']
+                self.test_suites = cached['suites']
+                self.logger.info(f"Loaded {len(self.test_suites)} test suites from TestNG XML cache")
+                return
             
-            # Extract tests
-            for test_elem in root.findall('.//test'):
-                test_data = {
-                    'name': test_elem.get('name'),
-                    'enabled': test_elem.get('enabled', 'true').lower() == 'true',
-                    'groups': [],
-                    'classes': [],
-                    'methods': []
-                }
-                
-                # Extract groups
-                for group in test_elem.findall('.//include'):
-                    test_data['groups'].append(group.get('name'))
-                
-                # Extract classes and methods
-                for class_elem in test_elem.findall('.//class'):
-                    class_name = class_elem.get('name')
-                    methods = []
-                    
-                    for method in class_elem.findall('.//include'):
-                        methods.append(method.get('name'))
-                    
-                    test_data['classes'].append(class_name)
-                    if methods:
-                        test_data['methods'].extend([f"{class_name}::{m}" for m in methods])
-                
-                self.test_suites.append(test_data)
+            self.suite_parameters, self.test_suites = self._parse_xml()
+            self._save_parse_cache(cache_key)
             
             self.logger.info(f"Parsed {len(self.test_suites)} test suites from TestNG XML")
             
         except Exception as e:
             self.logger.error(f"Error parsing TestNG XML: {str(e)}")
     
-    def run_suite(self, suite_name: str = None, verbose: bool = True) -> int:
+    def _parse_xml(self):
+        """
+        Parse suite parameters and tests from the XML file in one streaming pass
+        
+        Each <test> element is cleared once processed, so memory stays flat
+        for large suite files. Tags are matched without their namespace
+        (testng.xml declares xmlns on <suite>).
+        
+        Returns:
+            tuple: (suite parameters dict, list of test suite dicts)
+        """
+        suite_parameters = {}
+        test_suites = []
+        test_data = None
+        class_name = None
+        in_groups = False
+        
+        for event, elem in ET.iterparse(self.xml_path, events=('start', 'end')):
+            tag = elem.tag.rpartition('}')[2]
+            
+            if event == 'start':
+                if tag == 'test':
+                    test_data = {
+                        'name': elem.get('name'),
+                        'enabled': elem.get('enabled', 'true').lower() == 'true',
+                        'groups': [],
+                        'classes': [],
+                        'methods': []
+                    }
+                elif tag == 'groups':
+                    in_groups = True
+                elif tag == 'class' and test_data is not None:
+                    class_name = elem.get('name')
+                    test_data['classes'].append(class_name)
+                continue
+            
+            if tag == 'parameter':
+                suite_parameters[elem.get('name')] = elem.get('value')
+            elif tag == 'include' and test_data is not None:
+                if in_groups:
+                    test_data['groups'].append(elem.get('name'))
+                elif class_name:
+                    test_data['methods'].append(f"{class_name}::{elem.get('name')}")
+            elif tag == 'groups':
+                in_groups = False
+            elif tag == 'class':
+                class_name = None
+            elif tag == 'test':
+                test_suites.append(test_data)
+                test_data = None
+                elem.clear()
+        
+        return suite_parameters, test_suites
+    
+    def _parse_cache_path(self) -> Path:
+        """Get path of the parsed TestNG XML cache file"""
+        return self.xml_path.parent / PARSE_CACHE_FILE
+    
+    def _load_parse_cache(self) -> Dict:
+        """
+        Load the parsed TestNG XML cache
+        
+        Returns:
+            dict: Cache key -> {'parameters': ..., 'suites': ...} (empty if unavailable)
+        """
+        cache_path = self._parse_cache_path()
+        try:
+            with open(cache_path, encoding='utf-8') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_parse_cache(self, cache_key: str):
+        """
+        Write the parse result to the cache, replacing entries of older file versions
+        
+        Args:
+            cache_key: Key built from XML path and modification time
+        """
+        cache_path = self._parse_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(
+                    {cache_key: {'parameters': self.suite_parameters, 'suites': self.test_suites}},
+                    cache_file
+                )
+        except OSError as e:
+            self.logger.warning(f"Could not write TestNG XML cache {cache_path}: {str(e)}")
+    
+    def _run_pytest(self, pytest_args: List[str]) -> int:
+        """
+        Run pytest from the test root, in-process unless isolated
+        
+        Args:
+            pytest_args: pytest command line arguments
+            
+        Returns:
+            int: Exit code from pytest
+        """
+        if self.isolated:
+            return subprocess.run(['pytest'] + pytest_args, cwd=TEST_ROOT).returncode
+        with _chdir(TEST_ROOT):
+            return int(pytest.main(pytest_args))
+    
+    def run_suite(self, suite_name: str = None, verbose: bool = True,
+                  num_workers: int = None, tx: List[str] = None) -> int:
         """
         Run a specific test suite
         
         Args:
             suite_name: Name of suite to run (None = run all)
             verbose: Verbose output
+            num_workers: pytest-xdist workers (None = half the CPU cores, 0 = serial)
+            tx: pytest-xdist --tx specs for remote workers
             
         Returns:
             int: Exit code from pytest
@@ -100,29 +217,26 @@ class TestNGSuiteRunner:
                     return 1
             
             # Build pytest command
-            pytest_args = self._build_pytest_args(suites_to_run, verbose)
+            pytest_args = self._build_pytest_args(suites_to_run, verbose, num_workers, tx)
             
             self.logger.info(f"Running {len(suites_to_run)} suite(s)...")
             self.logger.info(f"Command: pytest {' '.join(pytest_args)}")
             
             # Execute pytest
-            result = subprocess.run(
-                ['pytest'] + pytest_args,
-                cwd='src/test/python'
-            )
-            
-            return result.returncode
+            return self._run_pytest(pytest_args)
             
         except Exception as e:
             self.logger.error(f"Error running test suite: {str(e)}")
             return 1
     
-    def run_group(self, group_name: str) -> int:
+    def run_group(self, group_name: str, num_workers: int = None, tx: List[str] = None) -> int:
         """
         Run tests by group name
         
         Args:
             group_name: Group name to run
+            num_workers: pytest-xdist workers (None = half the CPU cores, 0 = serial)
+            tx: pytest-xdist --tx specs for remote workers
             
         Returns:
             int: Exit code from pytest
@@ -132,15 +246,11 @@ class TestNGSuiteRunner:
             
             # Build pytest command with group marker
             pytest_args = ['tests', '-m', group_name, '-v']
+            pytest_args.extend(self._build_xdist_args(num_workers, tx))
             
             self.logger.info(f"Command: pytest {' '.join(pytest_args)}")
             
-            result = subprocess.run(
-                ['pytest'] + pytest_args,
-                cwd='src/test/python'
-            )
-            
-            return result.returncode
+            return self._run_pytest(pytest_args)
             
         except Exception as e:
             self.logger.error(f"Error running group: {str(e)}")
@@ -167,51 +277,91 @@ class TestNGSuiteRunner:
                 '--self-contained-html'
             ]
             
-            result = subprocess.run(
-                ['pytest'] + pytest_args,
-                cwd='src/test/python'
-            )
-            
-            return result.returncode
+            return self._run_pytest(pytest_args)
             
         except Exception as e:
             self.logger.error(f"Error running parallel tests: {str(e)}")
             return 1
     
-    def _build_pytest_args(self, suites: List[Dict], verbose: bool = True) -> List[str]:
+    def _build_xdist_args(self, num_workers: int = None, tx: List[str] = None) -> List[str]:
+        """
+        Build pytest-xdist arguments for parallel execution
+        
+        Tests are distributed per file (--dist=loadfile) so tests of one file
+        share a worker and its session driver.
+        
+        Args:
+            num_workers: Number of workers (None = half the CPU cores, 0 = serial)
+            tx: --tx specs for remote workers (e.g. 'ssh=user@node//python=python3')
+            
+        Returns:
+            List of pytest arguments (empty for serial runs)
+        """
+        if num_workers is None:
+            num_workers = (os.cpu_count() or 2) // 2
+        
+        args = []
+        if tx:
+            for spec in tx:
+                args.extend(['--tx', spec])
+        elif num_workers > 0:
+            args.extend(['-n', str(num_workers)])
+        
+        if args:
+            args.append('--dist=loadfile')
+        return args
+    
+    def _build_pytest_args(self, suites: List[Dict], verbose: bool = True,
+                           num_workers: int = None, tx: List[str] = None) -> List[str]:
         """
         Build pytest command line arguments from test suites
         
+        Running every suite needs no marker filter, so -m is omitted and
+        pytest collects without evaluating marker expressions per test.
+        Smoke-only runs skip coverage instrumentation.
+        
         Args:
             suites: Test suites to run
             verbose: Verbose output flag
+            num_workers: pytest-xdist workers (None = half the CPU cores, 0 = serial)
+            tx: pytest-xdist --tx specs for remote workers
             
         Returns:
             List of pytest arguments
         """
+        all_groups = frozenset(group for suite in suites for group in suite.get('groups') or ())
+        run_all = suites is self.test_suites
+        cache_key = (all_groups, run_all, verbose, num_workers, tuple(tx or ()))
+        cached = self._pytest_args_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         args = ['tests']
         
         if verbose:
             args.append('-v')
         
-        # Add markers for groups
-        all_groups = set()
-        for suite in suites:
-            if suite.get('groups'):
-                all_groups.update(suite['groups'])
+        args.extend(self._build_xdist_args(num_workers, tx))
         
-        if all_groups:
-            marker_expr = ' or '.join(all_groups)
+        # Add markers for groups (sorted so the expression is stable across runs)
+        if all_groups and not run_all:
+            marker_expr = ' or '.join(sorted(all_groups))
             args.extend(['-m', marker_expr])
         
         # Add HTML report
         args.extend([
             '--html=../../../reports/report.html',
-            '--self-contained-html',
-            '--cov=src/test/python',
-            '--cov-report=html:../../../reports/coverage'
+            '--self-contained-html'
         ])
         
+        # Coverage instrumentation slows every test; skip it for smoke runs
+        if all_groups != {'smoke'}:
+            args.extend([
+                '--cov=src/test/python',
+                '--cov-report=html:../../../reports/coverage'
+            ])
+        
+        self._pytest_args_cache[cache_key] = tuple(args)
         return args
     
     def list_suites(self):
@@ -265,7 +415,12 @@ def main():
     import sys
     
     logger = LoggerConfig.get_logger(__name__)
-    runner = TestNGSuiteRunner()
+    
+    # --isolated: run pytest in a subprocess instead of in-process
+    isolated = '--isolated' in sys.argv
+    if isolated:
+        sys.argv.remove('--isolated')
+    runner = TestNGSuiteRunner(isolated=isolated)
     
     if len(sys.argv) < 2:
         runner.list_suites()
@@ -274,6 +429,7 @@ def main():
         print("  python -m utilities.testng_suite_runner run <suite_name>")
         print("  python -m utilities.testng_suite_runner group <group_name>")
         print("  python -m utilities.testng_suite_runner parallel [num_workers]")
+        print("  Add --isolated to run pytest in a separate process")
         return 0
     
     command = sys.argv[1]
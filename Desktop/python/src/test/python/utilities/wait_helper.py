@@ -7,7 +7,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from utilities.logger_config import LoggerConfig
-from config.config_reader import ConfigReader
+from config.config_reader import get_config
 
 
 class WaitHelper:
@@ -17,7 +17,7 @@ class WaitHelper:
     """
     
     logger = LoggerConfig.get_logger(__name__)
-    config = ConfigReader()
+    config = get_config()
     
     def __init__(self, driver, wait_time=None):
         """
@@ -30,7 +30,51 @@ class WaitHelper:
         self.driver = driver
         self.wait_time = wait_time or self.config.get_explicit_wait()
         self.wait = WebDriverWait(driver, self.wait_time)
-        self.logger.debug(f"WaitHelper initialized with timeout: {self.wait_time}s")
+        # Custom timeout -> WebDriverWait, so repeated waits reuse one instance
+        self._wait_cache = {}
+        self.logger.debug("WaitHelper initialized with timeout: %ss", self.wait_time)
+    
+    def _get_wait(self, timeout=None):
+        """
+        Get a WebDriverWait for the given timeout, reusing cached instances
+        
+        Args:
+            timeout (int): Custom timeout in seconds, default timeout if None
+            
+        Returns:
+            WebDriverWait: Wait object bound to this helper's driver
+        """
+        if not timeout or timeout == self.wait_time:
+            return self.wait
+        wait_obj = self._wait_cache.get(timeout)
+        if wait_obj is None:
+            wait_obj = self._wait_cache[timeout] = WebDriverWait(self.driver, timeout)
+        return wait_obj
+    
+    def _until(self, condition, timeout, ok_msg, err_msg, *args):
+        """
+        Wait for a condition, logging success at debug level and timeouts as errors
+        
+        Args:
+            condition (callable): Condition receiving the driver
+            timeout (int): Custom timeout in seconds
+            ok_msg (str): %-style message logged when the condition is met
+            err_msg (str): %-style message logged on timeout
+            *args: Arguments for both messages
+            
+        Returns:
+            The truthy value returned by the condition
+            
+        Raises:
+            TimeoutException: If condition is not met within timeout
+        """
+        try:
+            result = self._get_wait(timeout).until(condition)
+        except TimeoutException:
+            self.logger.error(err_msg, *args)
+            raise
+        self.logger.debug(ok_msg, *args)
+        return result
     
     def wait_for_element_visible(self, locator, timeout=None):
         """
@@ -46,14 +90,33 @@ class WaitHelper:
         Raises:
             TimeoutException: If element not visible within timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            element = wait_obj.until(EC.visibility_of_element_located(locator))
-            self.logger.debug(f"Element {locator} is visible")
-            return element
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for element visibility: {locator}")
-            raise
+        return self._until(
+            EC.visibility_of_element_located(locator), timeout,
+            "Element %s is visible",
+            "Timeout waiting for element visibility: %s",
+            locator
+        )
+    
+    def wait_for(self, locator, timeout=None, condition=EC.visibility_of_element_located):
+        """
+        Wait for an expected condition on a locator, without error logging
+        
+        Meant for checks where a timeout is an expected outcome (e.g. "is an
+        error message shown?"), so pass a short timeout.
+        
+        Args:
+            locator (tuple): Selenium locator tuple (By.XPATH, locator_string)
+            timeout (int): Custom timeout in seconds
+            condition (callable): expected_conditions factory taking the locator
+            
+        Returns:
+            The value returned by the condition (usually the WebElement)
+            
+        Raises:
+            TimeoutException: If condition is not met within timeout
+        """
+        wait_obj = self._get_wait(timeout)
+        return wait_obj.until(condition(locator))
     
     def wait_for_element_present(self, locator, timeout=None):
         """
@@ -69,14 +132,12 @@ class WaitHelper:
         Raises:
             TimeoutException: If element not present within timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            element = wait_obj.until(EC.presence_of_element_located(locator))
-            self.logger.debug(f"Element {locator} is present in DOM")
-            return element
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for element presence: {locator}")
-            raise
+        return self._until(
+            EC.presence_of_element_located(locator), timeout,
+            "Element %s is present in DOM",
+            "Timeout waiting for element presence: %s",
+            locator
+        )
     
     def wait_for_element_clickable(self, locator, timeout=None):
         """
@@ -92,14 +153,12 @@ class WaitHelper:
         Raises:
             TimeoutException: If element not clickable within timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            element = wait_obj.until(EC.element_to_be_clickable(locator))
-            self.logger.debug(f"Element {locator} is clickable")
-            return element
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for element to be clickable: {locator}")
-            raise
+        return self._until(
+            EC.element_to_be_clickable(locator), timeout,
+            "Element %s is clickable",
+            "Timeout waiting for element to be clickable: %s",
+            locator
+        )
     
     def wait_for_element_invisible(self, locator, timeout=None):
         """
@@ -115,14 +174,12 @@ class WaitHelper:
         Raises:
             TimeoutException: If element still visible after timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            result = wait_obj.until(EC.invisibility_of_element_located(locator))
-            self.logger.debug(f"Element {locator} is invisible")
-            return result
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for element invisibility: {locator}")
-            raise
+        return self._until(
+            EC.invisibility_of_element_located(locator), timeout,
+            "Element %s is invisible",
+            "Timeout waiting for element invisibility: %s",
+            locator
+        )
     
     def wait_for_text_in_element(self, locator, text, timeout=None):
         """
@@ -139,14 +196,12 @@ class WaitHelper:
         Raises:
             TimeoutException: If text not found within timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            result = wait_obj.until(EC.text_to_be_present_in_element(locator, text))
-            self.logger.debug(f"Text '{text}' found in element {locator}")
-            return result
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for text '{text}' in element {locator}")
-            raise
+        return self._until(
+            EC.text_to_be_present_in_element(locator, text), timeout,
+            "Text '%s' found in element %s",
+            "Timeout waiting for text '%s' in element %s",
+            text, locator
+        )
     
     def wait_for_url_contains(self, url_text, timeout=None):
         """
@@ -162,14 +217,12 @@ class WaitHelper:
         Raises:
             TimeoutException: If URL doesn't contain text within timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            result = wait_obj.until(EC.url_contains(url_text))
-            self.logger.debug(f"URL contains '{url_text}'")
-            return result
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for URL to contain: {url_text}")
-            raise
+        return self._until(
+            EC.url_contains(url_text), timeout,
+            "URL contains '%s'",
+            "Timeout waiting for URL to contain: %s",
+            url_text
+        )
     
     def wait_for_title_contains(self, title_text, timeout=None):
         """
@@ -185,11 +238,31 @@ class WaitHelper:
         Raises:
             TimeoutException: If title doesn't contain text within timeout
         """
-        try:
-            wait_obj = WebDriverWait(self.driver, timeout or self.wait_time)
-            result = wait_obj.until(EC.title_contains(title_text))
-            self.logger.debug(f"Page title contains '{title_text}'")
-            return result
-        except TimeoutException:
-            self.logger.error(f"Timeout waiting for title to contain: {title_text}")
-            raise
+        return self._until(
+            EC.title_contains(title_text), timeout,
+            "Page title contains '%s'",
+            "Timeout waiting for title to contain: %s",
+            title_text
+        )
+    
+    def wait_for_condition(self, condition, timeout=None, description="condition"):
+        """
+        Wait for an arbitrary condition callable to return a truthy value
+        
+        Args:
+            condition (callable): Callable receiving the driver, e.g. a lambda
+            timeout (int): Custom timeout in seconds
+            description (str): Human readable condition name used in logs
+            
+        Returns:
+            The truthy value returned by the condition
+            
+        Raises:
+            TimeoutException: If condition is not met within timeout
+        """
+        return self._until(
+            condition, timeout,
+            "Condition met: %s",
+            "Timeout waiting for condition: %s",
+            description
+        )